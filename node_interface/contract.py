@@ -13,8 +13,11 @@ Design principles:
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional
 from datetime import datetime
+import itertools
+import time
 
 
 class Action(Enum):
@@ -43,9 +46,14 @@ class Action(Enum):
     EXECUTE = "execute"
     TODO_TO_DDS = "todo_to_dds"
 
+    # Members are singletons compared by identity, so hash by identity too
+    # (C-level) instead of Enum's Python-level hash(self._name_). Keeps the
+    # set/dict lookups done on every dispatch cheap.
+    __hash__ = object.__hash__
+
 
 # Classification: which actions are read-only
-_READ_ONLY_ACTIONS = frozenset({
+_READ_ONLY_ACTIONS: FrozenSet[Action] = frozenset({
     Action.SYSTEM_STATUS,
     Action.PROJECT_INFO,
     Action.PROJECT_SUMMARY,
@@ -58,7 +66,7 @@ _READ_ONLY_ACTIONS = frozenset({
     Action.TODO_LIST,
 })
 
-_WRITE_ACTIONS = frozenset({
+_WRITE_ACTIONS: FrozenSet[Action] = frozenset({
     Action.DDS_NEW,
     Action.DDS_APPROVE,
     Action.DDS_REJECT,
@@ -77,7 +85,7 @@ def is_write(action: Action) -> bool:
     return action in _WRITE_ACTIONS
 
 
-@dataclass
+@dataclass(slots=True)
 class ContractRequest:
     """
     Typed request that any interface must construct to invoke a system action.
@@ -96,7 +104,18 @@ class ContractRequest:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
-@dataclass
+# audit_id = AUDIT_PREFIX + process start (ns, hex) + per-process sequence:
+# unique, no clock formatting
+AUDIT_PREFIX = "AUD-"
+_AUDIT_EPOCH = time.time_ns()
+_AUDIT_SEQ = itertools.count()
+
+
+def _next_audit_id() -> str:
+    return f"{AUDIT_PREFIX}{_AUDIT_EPOCH:x}-{next(_AUDIT_SEQ):x}"
+
+
+@dataclass(slots=True)
 class ContractResponse:
     """
     Typed response returned by the Router for every action.
@@ -114,7 +133,7 @@ class ContractResponse:
     data: Optional[Dict[str, Any]] = None
     action: Optional[Action] = None
     read_only: bool = True
-    audit_id: str = field(default_factory=lambda: f"AUD-{datetime.now().strftime('%Y%m%d%H%M%S%f')}")
+    audit_id: str = field(default_factory=_next_audit_id)
 
 
 class ContractError(Exception):
@@ -137,6 +156,28 @@ PAYLOAD_SCHEMAS: Dict[Action, Dict[str, bool]] = {
     Action.TODO_TO_DDS: {"todo_id": True},
 }
 
+# Actions that accept any (including empty) payload
+ACTIONS_WITHOUT_SCHEMA: FrozenSet[Action] = frozenset(Action).difference(PAYLOAD_SCHEMAS)
+
+
+def _compile_validator(action: Action, required: tuple) -> Callable[[Dict[str, Any]], None]:
+    """Build a payload check for one action's required fields."""
+    def _validate(payload, _required=required, _err=ContractError):
+        for field_name in _required:
+            if field_name not in payload:
+                raise _err(
+                    f"Action {action.value} requires field '{field_name}' in payload"
+                )
+    return _validate
+
+
+# Compiled once from PAYLOAD_SCHEMAS; actions with no required fields have no entry
+_VALIDATORS: Dict[Action, Callable[[Dict[str, Any]], None]] = {
+    action: _compile_validator(action, required)
+    for action, schema in PAYLOAD_SCHEMAS.items()
+    if (required := tuple(name for name, is_required in schema.items() if is_required))
+}
+
 
 def validate_payload(action: Action, payload: Dict[str, Any]) -> None:
     """
@@ -145,31 +186,25 @@ def validate_payload(action: Action, payload: Dict[str, Any]) -> None:
     Raises:
         ContractError: If required fields are missing
     """
-    schema = PAYLOAD_SCHEMAS.get(action)
-    if schema is None:
-        # Actions without schema accept any (including empty) payload
-        return
-
-    for field_name, required in schema.items():
-        if required and field_name not in payload:
-            raise ContractError(
-                f"Action {action.value} requires field '{field_name}' in payload"
-            )
+    validator = _VALIDATORS.get(action)
+    if validator is not None:
+        validator(payload)
 
 
 # ──────────────────────────────────────────────
 # SOURCE PERMISSIONS — which sources can invoke which actions
 # ──────────────────────────────────────────────
 
-# Known sources and their permissions.
-# "all" means every action in the whitelist is allowed.
-# A frozenset restricts to specific actions only.
-SOURCE_PERMISSIONS: Dict[str, Any] = {
-    "telegram": "all",
-    "cli": "all",
+# Known sources and the frozenset of actions each may invoke.
+# Read-only mapping so permissions cannot be widened at runtime.
+_ALL_ACTIONS: FrozenSet[Action] = frozenset(Action)
+
+SOURCE_PERMISSIONS: Mapping[str, FrozenSet[Action]] = MappingProxyType({
+    "telegram": _ALL_ACTIONS,
+    "cli": _ALL_ACTIONS,
     "voice": _READ_ONLY_ACTIONS,  # voice v0: read-only only
     # Unknown sources get rejected by default
-}
+})
 
 
 def validate_source_permission(source: str, action: Action) -> None:
@@ -186,9 +221,6 @@ def validate_source_permission(source: str, action: Action) -> None:
             f"Unknown source '{source}'. Registered sources: {list(SOURCE_PERMISSIONS.keys())}"
         )
 
-    if permissions == "all":
-        return
-
     if action not in permissions:
         raise ContractError(
             f"Source '{source}' is not allowed to invoke action '{action.value}'. "
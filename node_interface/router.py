@@ -9,17 +9,7 @@ accessible to interfaces directly.
 """
 
 from shared.logger import setup_logger
-from shared.config import config
-from node_events.github_reader import GitHubProjectReader
-from node_events.summarizer import ProjectSummarizer, SummarizationUnavailable
-from node_events.gmail_reader import GmailReader, GmailUnavailable
-from node_projects.project_registry import ProjectRegistry, ProjectRegistryError
-from node_projects.project_status import ProjectStatus
-from node_dds.dds_registry import DDSRegistry, DDSRegistryError
-from node_dds.dds_proposal import DDSProposal
-from node_programmer.programmer import Programmer, ProgrammerError
-from node_programmer.execution_report import ExecutionReport
-from node_todo import TodoRegistry, TodoToDDSConverter
+from shared.config import config, parse_user_ids
 from node_interface.contract import (
     Action,
     ContractRequest,
@@ -31,10 +21,23 @@ from node_interface.contract import (
     validate_source_permission,
 )
 from datetime import datetime
+from types import SimpleNamespace
+from typing import Callable, TextIO, TypedDict
+import importlib
 import json
 import os
 import time
 
+# Audit entries are serialized compactly; orjson is used when installed
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj, _d=json.dumps) -> str:
+        return _d(obj, ensure_ascii=False, separators=(",", ":"))
+
 logger = setup_logger(__name__)
 
 # ──────────────────────────────────────────────
@@ -53,7 +56,27 @@ def _extract_payload_summary(payload: dict) -> dict:
     return {k: v for k, v in payload.items() if k in _TRACEABLE_KEYS}
 
 
+class _AuditEntryFields(TypedDict):
+    audit_id: str
+    timestamp: str
+    source: str
+    user_id: str
+    action: str
+    level: str
+    payload_keys: list[str]
+    payload_summary: dict
+    status: str
+    read_only: bool
+    duration_ms: int
+
+
+class AuditEntry(_AuditEntryFields, total=False):
+    """One JSON line of AUDIT_FILE; error_detail is only present on failure."""
+    error_detail: str
+
+
 def _persist_audit(
+    write: Callable[[str], None],
     request: ContractRequest,
     response: ContractResponse,
     *,
@@ -62,7 +85,7 @@ def _persist_audit(
     duration_ms: int = 0,
 ) -> None:
     """
-    Append audit entry to JSONL file (one JSON object per line, append-only).
+    Append audit entry via write() (one JSON object per line, append-only).
     
     Enriched fields (v1.1):
         level: info | decision | guard_reject | error
@@ -73,7 +96,7 @@ def _persist_audit(
     Never raises — audit failure must not break dispatch.
     """
     try:
-        entry = {
+        entry: AuditEntry = {
             "audit_id": response.audit_id,
             "timestamp": request.timestamp,
             "source": request.source,
@@ -88,9 +111,7 @@ def _persist_audit(
         }
         if error_detail:
             entry["error_detail"] = error_detail
-        os.makedirs(os.path.dirname(AUDIT_FILE), exist_ok=True)
-        with open(AUDIT_FILE, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        write(_dumps(entry) + "\n")
     except Exception as e:
         logger.warning(f"Audit persistence failed (non-fatal): {e}")
 
@@ -99,6 +120,10 @@ def _persist_audit(
 # USER AUTHENTICATION
 # ──────────────────────────────────────────────
 
+# (raw ALLOWED_USER_IDS, parsed set) — re-parsed only when the raw value changes
+_allowed_users_cache: tuple[str, frozenset[str]] = ("", frozenset())
+
+
 def _is_user_allowed(user_id: str) -> bool:
     """
     Check if user_id is in the allowed list.
@@ -107,25 +132,75 @@ def _is_user_allowed(user_id: str) -> bool:
     This is intentional: the system should work without auth configured,
     but become strict the moment you set the env var.
     """
-    allowed_raw = config.ALLOWED_USER_IDS
-    if not allowed_raw or not allowed_raw.strip():
+    global _allowed_users_cache
+    raw = config.ALLOWED_USER_IDS or ""
+    if raw != _allowed_users_cache[0]:
+        _allowed_users_cache = (raw, parse_user_ids(raw))
+    allowed_ids = _allowed_users_cache[1]
+    if not allowed_ids:
         return True  # Auth disabled — development mode
     
-    allowed_ids = {uid.strip() for uid in allowed_raw.split(",") if uid.strip()}
     return str(user_id) in allowed_ids
 
 
+# Handler dependencies: (module, names) imported per Router by _load_handlers()
+_HANDLER_DEPENDENCIES = (
+    ("node_events.github_reader", ("GitHubProjectReader",)),
+    ("node_events.summarizer", ("ProjectSummarizer", "SummarizationUnavailable")),
+    ("node_events.gmail_reader", ("GmailReader", "GmailUnavailable")),
+    ("node_projects.project_registry", ("ProjectRegistry", "ProjectRegistryError")),
+    ("node_projects.project_status", ("ProjectStatus",)),
+    ("node_dds.dds_registry", ("DDSRegistry", "DDSRegistryError")),
+    ("node_dds.dds_proposal", ("DDSProposal",)),
+    ("node_programmer.programmer", ("Programmer", "ProgrammerError")),
+    ("node_programmer.execution_report", ("ExecutionReport",)),
+    ("node_todo", ("TodoRegistry", "TodoToDDSConverter")),
+)
+
+
+# Status icons for DDS listings (unknown statuses fall back to ⏳)
+_DDS_STATUS_ICONS = {
+    "approved": "✅",
+    "rejected": "❌",
+    "proposed": "📋",
+    "executed": "🏁",
+    "failed": "💥",
+}
+
+
 class Router:
     """
     Governed Router — single dispatch entry point for all interfaces.
 
-    Public API: dispatch(request) only.
+    Public API: dispatch(request) and dispatch_many(requests) only.
     All business methods are private (_prefixed) and unreachable from interfaces.
     """
 
-    def __init__(self):
-        """Initialize router and internal dispatch table"""
+    def __init__(self, audit_sink: TextIO | None = None):
+        """
+        Initialize router and internal dispatch table
+
+        Args:
+            audit_sink: Text stream that receives audit lines; the caller
+                owns it and close() leaves it open. Defaults to AUDIT_FILE,
+                opened (append, line-buffered) on the first audited dispatch
+                and kept open until close(). The open handle does not follow
+                later reassignment of AUDIT_FILE or log rotation; call
+                close() to have the next dispatch reopen the current path.
+        """
         logger.info("Router initialized")
+        self._audit = audit_sink
+        self._owns_audit = audit_sink is None
+        self.reset_handlers()
+
+    def reset_handlers(self) -> None:
+        """
+        Rebind this Router's handler dependencies from the current sys.modules.
+
+        Drops lazily created handler instances and rebuilds the dispatch
+        table. Lets tests install module mocks on an existing Router without
+        reloading this module; other Router instances are unaffected.
+        """
         self._summarizer = None
         self._gmail_reader = None
         self._project_registry = None
@@ -134,10 +209,17 @@ class Router:
         self._programmer = None
         self._todo_registry = None
         self._todo_converter = None
+        self._dispatch_table = self._build_handler_table()
 
-        # Dispatch table: Action -> handler method
-        # This is the ONLY mapping between contract actions and internal logic.
-        self._dispatch_table = {
+    def _build_handler_table(self) -> dict[Action, Callable]:
+        """
+        Resolve handler dependencies and return the dispatch table.
+
+        Dispatch table: Action -> handler method.
+        This is the ONLY mapping between contract actions and internal logic.
+        """
+        self._load_handlers()
+        return {
             Action.SYSTEM_STATUS: self._handle_system_status,
             Action.PROJECT_INFO: self._handle_project_info,
             Action.PROJECT_SUMMARY: self._handle_project_summary,
@@ -155,8 +237,42 @@ class Router:
             Action.TODO_TO_DDS: self._handle_todo_to_dds,
         }
 
+    def _load_handlers(self) -> None:
+        """
+        Import the node modules used by the handlers onto this Router.
+
+        Deferred from module import so importing the contract layer does not
+        pull in the Gmail/GitHub/Aider clients. Modules are resolved through
+        sys.modules when called, so mocks installed beforehand are picked up.
+        """
+        self._deps = SimpleNamespace(**{
+            name: getattr(importlib.import_module(module), name)
+            for module, names in _HANDLER_DEPENDENCIES
+            for name in names
+        })
+
+    def close(self) -> None:
+        """Close the AUDIT_FILE handle this Router opened, if any."""
+        if self._owns_audit and self._audit is not None:
+            self._audit.close()
+            self._audit = None
+
+    def __enter__(self) -> "Router":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _write_audit(self, line: str) -> None:
+        """Write one serialized audit line to the audit sink."""
+        if self._audit is None:
+            os.makedirs(os.path.dirname(AUDIT_FILE), exist_ok=True)
+            self._audit = open(AUDIT_FILE, "a", encoding="utf-8", buffering=1)
+        self._audit.write(line)
+        self._audit.flush()
+
     # ──────────────────────────────────────────────
-    # PUBLIC API — the ONLY method interfaces may call
+    # PUBLIC API — the ONLY methods interfaces may call
     # ──────────────────────────────────────────────
 
     def dispatch(self, request: ContractRequest) -> ContractResponse:
@@ -178,6 +294,32 @@ class Router:
         Returns:
             ContractResponse with status, message, and optional data
         """
+        return self._dispatch(request, self._write_audit)
+
+    def dispatch_many(self, requests: list[ContractRequest]) -> list[ContractResponse]:
+        """
+        Dispatch several requests in order, with the same guards as dispatch().
+
+        Audit lines are collected and written to the audit sink in one write
+        after the last request, instead of once per request.
+
+        Returns:
+            One ContractResponse per request, in order
+        """
+        lines: list[str] = []
+        try:
+            return [self._dispatch(request, lines.append) for request in requests]
+        finally:
+            if lines:
+                try:
+                    self._write_audit("".join(lines))
+                except Exception as e:
+                    logger.warning(f"Audit persistence failed (non-fatal): {e}")
+
+    def _dispatch(
+        self, request: ContractRequest, write_audit: Callable[[str], None]
+    ) -> ContractResponse:
+        """Run the guard chain and handler; audit lines go to write_audit()."""
         _t0 = time.monotonic()
 
         logger.info(
@@ -198,7 +340,7 @@ class Router:
                 action=None,
                 read_only=True,
             )
-            _persist_audit(request, response,
+            _persist_audit(write_audit, request, response,
                            level="guard_reject",
                            error_detail="action_not_in_whitelist",
                            duration_ms=_elapsed_ms())
@@ -216,7 +358,7 @@ class Router:
                 action=request.action,
                 read_only=is_read_only(request.action),
             )
-            _persist_audit(request, response,
+            _persist_audit(write_audit, request, response,
                            level="guard_reject",
                            error_detail=f"user_not_allowed:{request.user_id}",
                            duration_ms=_elapsed_ms())
@@ -233,7 +375,7 @@ class Router:
                 action=request.action,
                 read_only=is_read_only(request.action),
             )
-            _persist_audit(request, response,
+            _persist_audit(write_audit, request, response,
                            level="guard_reject",
                            error_detail=f"source_denied:{request.source}",
                            duration_ms=_elapsed_ms())
@@ -250,7 +392,7 @@ class Router:
                 action=request.action,
                 read_only=is_read_only(request.action),
             )
-            _persist_audit(request, response,
+            _persist_audit(write_audit, request, response,
                            level="guard_reject",
                            error_detail=f"payload_invalid:{str(e)}",
                            duration_ms=_elapsed_ms())
@@ -266,7 +408,7 @@ class Router:
                 action=request.action,
                 read_only=is_read_only(request.action),
             )
-            _persist_audit(request, response,
+            _persist_audit(write_audit, request, response,
                            level="error",
                            error_detail="no_handler_registered",
                            duration_ms=_elapsed_ms())
@@ -275,10 +417,12 @@ class Router:
         # 6. Execute handler
         error_detail = ""
         try:
-            message = handler(request.payload)
+            result = handler(request.payload)
+            message, data = result if isinstance(result, tuple) else (result, None)
             response = ContractResponse(
                 status="ok",
                 message=message,
+                data=data,
                 action=request.action,
                 read_only=is_read_only(request.action),
             )
@@ -298,7 +442,7 @@ class Router:
             level = "decision"
         elif response.status == "error":
             level = "error"
-        _persist_audit(request, response,
+        _persist_audit(write_audit, request, response,
                        level=level,
                        error_detail=error_detail,
                        duration_ms=_elapsed_ms())
@@ -306,7 +450,8 @@ class Router:
 
     # ──────────────────────────────────────────────
     # PRIVATE HANDLERS — not accessible from interfaces
-    # Each handler receives payload dict and returns a string message.
+    # Each handler receives payload dict and returns a string message,
+    # or a (message, data) tuple when it has structured data to return.
     # The existing logic is preserved exactly as-is.
     # ──────────────────────────────────────────────
 
@@ -324,7 +469,7 @@ class Router:
         logger.info(f"Project query received: {name}")
 
         if name.lower() == "fitnessai":
-            reader = GitHubProjectReader("AlexReinosoPerez", "FitnessAi")
+            reader = self._deps.GitHubProjectReader("AlexReinosoPerez", "FitnessAi")
             return reader.get_project_status()
 
         return "❌ Proyecto no reconocido"
@@ -335,9 +480,9 @@ class Router:
 
         if name.lower() == "fitnessai":
             if self._summarizer is None:
-                self._summarizer = ProjectSummarizer()
+                self._summarizer = self._deps.ProjectSummarizer()
 
-            reader = GitHubProjectReader("AlexReinosoPerez", "FitnessAi")
+            reader = self._deps.GitHubProjectReader("AlexReinosoPerez", "FitnessAi")
             raw_text = reader.get_project_status()
 
             if raw_text.startswith("❌"):
@@ -345,7 +490,7 @@ class Router:
 
             try:
                 return self._summarizer.summarize(raw_text)
-            except SummarizationUnavailable as e:
+            except self._deps.SummarizationUnavailable as e:
                 logger.warning(f"Summarization unavailable: {e}")
                 return (
                     "⚠️ Síntesis no disponible en este entorno.\n"
@@ -360,11 +505,11 @@ class Router:
 
         if self._gmail_reader is None:
             try:
-                self._gmail_reader = GmailReader(
+                self._gmail_reader = self._deps.GmailReader(
                     credentials_path=config.GMAIL_CREDENTIALS_PATH,
                     token_path=config.GMAIL_TOKEN_PATH,
                 )
-            except GmailUnavailable as e:
+            except self._deps.GmailUnavailable as e:
                 logger.warning(f"Gmail initialization failed: {e}")
                 return (
                     "⚠️ Gmail no disponible.\n\n"
@@ -377,7 +522,7 @@ class Router:
 
         try:
             return self._gmail_reader.get_recent_emails(count)
-        except GmailUnavailable as e:
+        except self._deps.GmailUnavailable as e:
             logger.warning(f"Gmail unavailable: {e}")
             return (
                 "⚠️ Error accediendo a Gmail.\n\n"
@@ -392,14 +537,14 @@ class Router:
         logger.info("Projects list query received")
 
         if self._project_registry is None:
-            self._project_registry = ProjectRegistry()
+            self._project_registry = self._deps.ProjectRegistry()
 
         if self._project_status is None:
-            self._project_status = ProjectStatus(self._project_registry)
+            self._project_status = self._deps.ProjectStatus(self._project_registry)
 
         try:
             return self._project_status.summarize_all()
-        except ProjectRegistryError as e:
+        except self._deps.ProjectRegistryError as e:
             logger.error(f"Project registry error: {e}")
             return (
                 "❌ Error accediendo al registro de proyectos.\n"
@@ -411,14 +556,14 @@ class Router:
         logger.info(f"Project status query received: {name}")
 
         if self._project_registry is None:
-            self._project_registry = ProjectRegistry()
+            self._project_registry = self._deps.ProjectRegistry()
 
         if self._project_status is None:
-            self._project_status = ProjectStatus(self._project_registry)
+            self._project_status = self._deps.ProjectStatus(self._project_registry)
 
         try:
             return self._project_status.summarize_one(name)
-        except ProjectRegistryError as e:
+        except self._deps.ProjectRegistryError as e:
             logger.error(f"Project registry error: {e}")
             return (
                 "❌ Error accediendo al registro de proyectos.\n"
@@ -429,7 +574,7 @@ class Router:
         logger.info("DDS list query received")
 
         if self._dds_registry is None:
-            self._dds_registry = DDSRegistry()
+            self._dds_registry = self._deps.DDSRegistry()
 
         try:
             proposals = self._dds_registry.list_proposals()
@@ -440,13 +585,7 @@ class Router:
             lines = [f"📝 Propuestas DDS ({len(proposals)})\n"]
 
             for proposal in proposals:
-                status_icon = {
-                    "approved": "✅",
-                    "rejected": "❌",
-                    "proposed": "📋",
-                    "executed": "🏁",
-                    "failed": "💥",
-                }.get(proposal.status, "⏳")
+                status_icon = _DDS_STATUS_ICONS.get(proposal.status, "⏳")
                 lines.append(f"\n{status_icon} {proposal.id}")
                 lines.append(f"   Proyecto: {proposal.project}")
                 lines.append(f"   Título: {proposal.title}")
@@ -455,27 +594,27 @@ class Router:
 
             return "\n".join(lines)
 
-        except DDSRegistryError as e:
+        except self._deps.DDSRegistryError as e:
             logger.error(f"DDS registry error: {e}")
             return (
                 "❌ Error accediendo al registro DDS.\n"
                 "Verifica que dds.json sea válido."
             )
 
-    def _handle_dds_new(self, payload: dict) -> str:
+    def _handle_dds_new(self, payload: dict) -> str | tuple[str, dict]:
         project = payload["project"]
         title = payload["title"]
         description = payload["description"]
         logger.info(f"DDS new proposal: {project} - {title}")
 
         if self._dds_registry is None:
-            self._dds_registry = DDSRegistry()
+            self._dds_registry = self._deps.DDSRegistry()
 
         try:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             proposal_id = f"DDS-{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
 
-            proposal = DDSProposal(
+            proposal = self._deps.DDSProposal(
                 id=proposal_id,
                 project=project,
                 title=title,
@@ -486,14 +625,15 @@ class Router:
 
             self._dds_registry.add_proposal(proposal)
 
-            return (
+            message = (
                 f"✅ Propuesta creada exitosamente\n\n"
                 f"ID: {proposal_id}\n"
                 f"Proyecto: {project}\n"
                 f"Título: {title}"
             )
+            return message, {"proposal_id": proposal_id}
 
-        except DDSRegistryError as e:
+        except self._deps.DDSRegistryError as e:
             logger.error(f"DDS registry error: {e}")
             return "❌ Error creando propuesta DDS"
 
@@ -502,7 +642,7 @@ class Router:
         logger.info(f"DDS approve: {proposal_id}")
 
         if self._dds_registry is None:
-            self._dds_registry = DDSRegistry()
+            self._dds_registry = self._deps.DDSRegistry()
 
         try:
             success = self._dds_registry.approve(proposal_id)
@@ -518,7 +658,7 @@ class Router:
             else:
                 return f"❌ DDS no encontrado: {proposal_id}"
 
-        except DDSRegistryError as e:
+        except self._deps.DDSRegistryError as e:
             logger.error(f"DDS registry error: {e}")
             return "❌ Error aprobando DDS"
 
@@ -527,7 +667,7 @@ class Router:
         logger.info(f"DDS reject: {proposal_id}")
 
         if self._dds_registry is None:
-            self._dds_registry = DDSRegistry()
+            self._dds_registry = self._deps.DDSRegistry()
 
         try:
             success = self._dds_registry.reject(proposal_id)
@@ -542,7 +682,7 @@ class Router:
             else:
                 return f"❌ DDS no encontrado: {proposal_id}"
 
-        except DDSRegistryError as e:
+        except self._deps.DDSRegistryError as e:
             logger.error(f"DDS registry error: {e}")
             return "❌ Error rechazando DDS"
 
@@ -551,18 +691,18 @@ class Router:
         logger.info(f"Execution request for DDS: {dds_id}")
 
         if self._programmer is None:
-            self._programmer = Programmer()
+            self._programmer = self._deps.Programmer()
 
         try:
             with open("node_dds/dds.json", "r") as f:
                 data = json.load(f)
         except FileNotFoundError:
-            raise ProgrammerError(
+            raise self._deps.ProgrammerError(
                 "[dds_error] No se encontró el archivo dds.json. "
                 "Verifica que node_dds/dds.json existe y es válido."
             )
         except json.JSONDecodeError:
-            raise ProgrammerError(
+            raise self._deps.ProgrammerError(
                 "[dds_error] dds.json corrupto. "
                 "El archivo no contiene JSON válido."
             )
@@ -574,13 +714,13 @@ class Router:
                 break
 
         if not dds_found:
-            raise ProgrammerError(
+            raise self._deps.ProgrammerError(
                 f"[dds_error] DDS {dds_id} not found in registry. "
                 f"Usa /dds para ver los DDS disponibles."
             )
 
         if dds_found.get("status") != "approved":
-            raise ProgrammerError(
+            raise self._deps.ProgrammerError(
                 f"[dds_error] DDS {dds_id} not found or not approved. "
                 f"Estado actual: {dds_found.get('status')}. "
                 f"Aprueba primero con /dds_approve {dds_id}"
@@ -596,7 +736,7 @@ class Router:
             elif action_type == "noop":
                 report = self._programmer.execute_noop(dds_id)
             else:
-                raise ProgrammerError(
+                raise self._deps.ProgrammerError(
                     f"[dds_error] Tipo de acción no soportado: '{action_type}'. "
                     f"Solo code_change, code_fix, touch_file y noop son válidos."
                 )
@@ -609,7 +749,7 @@ class Router:
                 f"Notas: {report.notes}"
             )
 
-        except ProgrammerError as e:
+        except self._deps.ProgrammerError as e:
             error_msg = str(e)
             # Classify the error for human triage
             if "already been executed" in error_msg or "already executed" in error_msg:
@@ -640,7 +780,7 @@ class Router:
             logger.error(f"Execution error [{category}]: {error_msg}")
             # Re-raise with category prefix so dispatch() captures it
             # in error_detail and marks status=error in the audit
-            raise ProgrammerError(
+            raise self._deps.ProgrammerError(
                 f"[{category}] {error_msg[:200]}\n"
                 f"Acción: {hint}"
             ) from e
@@ -649,7 +789,7 @@ class Router:
         logger.info("Execution status query received")
 
         if self._programmer is None:
-            self._programmer = Programmer()
+            self._programmer = self._deps.Programmer()
 
         try:
             report = self._programmer.get_last_report()
@@ -668,14 +808,14 @@ class Router:
                 f"Notas: {report.notes}"
             )
 
-        except ProgrammerError as e:
+        except self._deps.ProgrammerError as e:
             logger.error(f"Status query error: {e}")
             return "❌ Error consultando estado de ejecuciones"
 
     def _handle_todo_list(self, payload: dict) -> str:
         try:
             if self._todo_registry is None:
-                self._todo_registry = TodoRegistry()
+                self._todo_registry = self._deps.TodoRegistry()
 
             todos = self._todo_registry.list_todos()
 
@@ -711,9 +851,9 @@ class Router:
         todo_id = payload["todo_id"]
         try:
             if self._todo_registry is None:
-                self._todo_registry = TodoRegistry()
+                self._todo_registry = self._deps.TodoRegistry()
             if self._todo_converter is None:
-                self._todo_converter = TodoToDDSConverter()
+                self._todo_converter = self._deps.TodoToDDSConverter()
 
             todo = self._todo_registry.get_todo(todo_id)
             if not todo:
@@ -748,7 +888,7 @@ class Router:
     def _handle_dds_list_proposed(self, payload: dict) -> str:
         try:
             if self._dds_registry is None:
-                self._dds_registry = DDSRegistry()
+                self._dds_registry = self._deps.DDSRegistry()
 
             proposed = self._dds_registry.list_proposed()
 
@@ -766,10 +906,18 @@ class Router:
 
             return "\n".join(lines)
 
-        except DDSRegistryError as e:
+        except self._deps.DDSRegistryError as e:
             logger.error(f"Error listing proposed DDS: {e}")
             return "❌ Error listando DDS propuestos"
 
 
-# Global router instance
-router = Router()
+# Shared router instance, built on first use by get_router()
+_router: Router | None = None
+
+
+def get_router() -> Router:
+    """Return the process-wide Router, creating it on first call."""
+    global _router
+    if _router is None:
+        _router = Router()
+    return _router
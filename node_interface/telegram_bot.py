@@ -11,7 +11,7 @@ from telegram.ext import Application, CommandHandler, ContextTypes
 
 from shared.config import config
 from shared.logger import setup_logger
-from node_interface.router import router
+from node_interface.router import get_router
 from node_interface.contract import Action, ContractRequest
 
 logger = setup_logger(__name__, level=config.LOG_LEVEL)
@@ -108,7 +108,7 @@ class TelegramBot:
         """Handle /status command"""
         logger.info(f"Command /status received from user {update.effective_user.id}")
         request = _make_request(Action.SYSTEM_STATUS, user_id=update.effective_user.id)
-        response = router.dispatch(request)
+        response = get_router().dispatch(request)
         await update.message.reply_text(response.message)
 
     async def project_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -127,7 +127,7 @@ class TelegramBot:
             payload={"name": context.args[0]},
             user_id=update.effective_user.id,
         )
-        response = router.dispatch(request)
+        response = get_router().dispatch(request)
         await update.message.reply_text(response.message)
 
     async def project_summary_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -146,7 +146,7 @@ class TelegramBot:
             payload={"name": context.args[0]},
             user_id=update.effective_user.id,
         )
-        response = router.dispatch(request)
+        response = get_router().dispatch(request)
         await update.message.reply_text(response.message)
 
     async def inbox_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -174,14 +174,14 @@ class TelegramBot:
             payload={"count": count},
             user_id=update.effective_user.id,
         )
-        response = router.dispatch(request)
+        response = get_router().dispatch(request)
         await update.message.reply_text(response.message)
 
     async def projects_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /projects command"""
         logger.info(f"Command /projects received from user {update.effective_user.id}")
         request = _make_request(Action.PROJECT_LIST, user_id=update.effective_user.id)
-        response = router.dispatch(request)
+        response = get_router().dispatch(request)
         await update.message.reply_text(response.message)
 
     async def project_status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -200,14 +200,14 @@ class TelegramBot:
             payload={"name": context.args[0]},
             user_id=update.effective_user.id,
         )
-        response = router.dispatch(request)
+        response = get_router().dispatch(request)
         await update.message.reply_text(response.message)
 
     async def dds_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /dds command"""
         logger.info(f"Command /dds received from user {update.effective_user.id}")
         request = _make_request(Action.DDS_LIST, user_id=update.effective_user.id)
-        response = router.dispatch(request)
+        response = get_router().dispatch(request)
         await update.message.reply_text(response.message)
 
     async def dds_new_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -230,7 +230,7 @@ class TelegramBot:
             },
             user_id=update.effective_user.id,
         )
-        response = router.dispatch(request)
+        response = get_router().dispatch(request)
         await update.message.reply_text(response.message)
 
     async def dds_approve_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -249,7 +249,7 @@ class TelegramBot:
             payload={"proposal_id": context.args[0]},
             user_id=update.effective_user.id,
         )
-        response = router.dispatch(request)
+        response = get_router().dispatch(request)
         await update.message.reply_text(response.message)
 
     async def dds_reject_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -268,7 +268,7 @@ class TelegramBot:
             payload={"proposal_id": context.args[0]},
             user_id=update.effective_user.id,
         )
-        response = router.dispatch(request)
+        response = get_router().dispatch(request)
         await update.message.reply_text(response.message)
 
     async def execute_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -287,21 +287,21 @@ class TelegramBot:
             payload={"dds_id": context.args[0]},
             user_id=update.effective_user.id,
         )
-        response = router.dispatch(request)
+        response = get_router().dispatch(request)
         await update.message.reply_text(response.message)
 
     async def exec_status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /exec_status command"""
         logger.info(f"Command /exec_status received from user {update.effective_user.id}")
         request = _make_request(Action.EXEC_STATUS, user_id=update.effective_user.id)
-        response = router.dispatch(request)
+        response = get_router().dispatch(request)
         await update.message.reply_text(response.message)
 
     async def todo_list_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /todo_list command"""
         logger.info(f"Command /todo_list received from user {update.effective_user.id}")
         request = _make_request(Action.TODO_LIST, user_id=update.effective_user.id)
-        response = router.dispatch(request)
+        response = get_router().dispatch(request)
         await update.message.reply_text(response.message)
 
     async def todo_to_dds_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -320,14 +320,14 @@ class TelegramBot:
             payload={"todo_id": context.args[0]},
             user_id=update.effective_user.id,
         )
-        response = router.dispatch(request)
+        response = get_router().dispatch(request)
         await update.message.reply_text(response.message)
 
     async def dds_list_proposed_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /dds_list_proposed command"""
         logger.info(f"Command /dds_list_proposed received from user {update.effective_user.id}")
         request = _make_request(Action.DDS_LIST_PROPOSED, user_id=update.effective_user.id)
-        response = router.dispatch(request)
+        response = get_router().dispatch(request)
         await update.message.reply_text(response.message)
 
     def run(self):
@@ -29,6 +29,10 @@ class FailureAnalyzer:
         """Mark a DDS ID as already processed (fix proposed or skipped)."""
         self._processed_dds_ids.add(dds_id)
     
+    def reset_processed(self) -> None:
+        """Forget all processed DDS IDs (fresh detection state)."""
+        self._processed_dds_ids.clear()
+    
     # Error patterns that indicate env/infra issues — NOT fixable by code_fix
     _UNFIXABLE_PATTERNS = [
         "timeout",          # Execution timeout — no diagnostic info
@@ -27,8 +27,9 @@ import time
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+os.chdir(_ROOT)
 
 from node_interface.contract import Action, ContractRequest
 from node_interface.router import Router
@@ -206,6 +207,14 @@ def apply_checklist(fix: Dict, all_fixes: List[Dict]) -> Tuple[List[bool], List[
     return results, notes
 
 
+def format_checklist(results: List[bool], notes: List[str]) -> str:
+    """Render checklist results as a single block (one write instead of ten)."""
+    return "\n".join(
+        f"     {'✅' if r else '❌'} {name}{(' — ' + n) if n else ''}"
+        for name, r, n in zip(CHECKLIST_NAMES, results, notes)
+    )
+
+
 # ══════════════════════════════════════════════
 # CYCLE RUNNER
 # ══════════════════════════════════════════════
@@ -308,9 +317,7 @@ fix_c2 = [f for f in fixes_c2 if f.get("source_dds") == c2_id]
 if fix_c2:
     results, notes = apply_checklist(fix_c2[0], fixes_c2)
     print(f"   Checklist: {sum(results)}/10 passed")
-    for i, (r, n) in enumerate(zip(results, notes)):
-        mark = "✅" if r else "❌"
-        print(f"     {mark} {CHECKLIST_NAMES[i]}{(' — ' + n) if n else ''}")
+    print(format_checklist(results, notes))
     
     log.add(2, "dds_error: missing instructions", fix_generated=True,
             checklist_results=results, checklist_notes=notes,
@@ -355,9 +362,7 @@ fix_c3 = [f for f in fixes_c3 if f.get("source_dds") == c3_id]
 if fix_c3:
     results, notes = apply_checklist(fix_c3[0], fixes_c3)
     print(f"   Checklist: {sum(results)}/10 passed")
-    for i, (r, n) in enumerate(zip(results, notes)):
-        mark = "✅" if r else "❌"
-        print(f"     {mark} {CHECKLIST_NAMES[i]}{(' — ' + n) if n else ''}")
+    print(format_checklist(results, notes))
     
     log.add(3, "exec_error: ImportError in project code", fix_generated=True,
             checklist_results=results, checklist_notes=notes,
@@ -401,9 +406,7 @@ fix_c4 = [f for f in fixes_c4 if f.get("source_dds") == c4_id]
 if fix_c4:
     results, notes = apply_checklist(fix_c4[0], fixes_c4)
     print(f"   Checklist: {sum(results)}/10 passed")
-    for i, (r, n) in enumerate(zip(results, notes)):
-        mark = "✅" if r else "❌"
-        print(f"     {mark} {CHECKLIST_NAMES[i]}{(' — ' + n) if n else ''}")
+    print(format_checklist(results, notes))
     
     log.add(4, "exec_error: SyntaxError", fix_generated=True,
             checklist_results=results, checklist_notes=notes,
@@ -448,9 +451,7 @@ if fix_c5:
     # Fix WAS generated — apply checklist to see if criterion 3 catches it
     results, notes = apply_checklist(fix_c5[0], fixes_c5)
     print(f"   ⚠️  Fix generated (system allows it) — Checklist: {sum(results)}/10")
-    for i, (r, n) in enumerate(zip(results, notes)):
-        mark = "✅" if r else "❌"
-        print(f"     {mark} {CHECKLIST_NAMES[i]}{(' — ' + n) if n else ''}")
+    print(format_checklist(results, notes))
     
     log.add(5, "env_error: timeout", fix_generated=True,
             checklist_results=results, checklist_notes=notes,
@@ -566,9 +567,7 @@ if fixes_c8:
     fix = fixes_c8[0]
     results, notes = apply_checklist(fix, get_fixes())
     print(f"   Checklist: {sum(results)}/10")
-    for i, (r, n) in enumerate(zip(results, notes)):
-        mark = "✅" if r else "❌"
-        print(f"     {mark} {CHECKLIST_NAMES[i]}{(' — ' + n) if n else ''}")
+    print(format_checklist(results, notes))
     
     # Extra check: fix constraints should be ≤ original
     fix_max = fix.get("constraints", {}).get("max_files_changed", 99)
@@ -617,9 +616,7 @@ if fixes_c9:
     fix = fixes_c9[0]
     results, notes = apply_checklist(fix, get_fixes())
     print(f"   Checklist: {sum(results)}/10")
-    for i, (r, n) in enumerate(zip(results, notes)):
-        mark = "✅" if r else "❌"
-        print(f"     {mark} {CHECKLIST_NAMES[i]}{(' — ' + n) if n else ''}")
+    print(format_checklist(results, notes))
     
     log.add(9, "dds_error: project doesn't exist", fix_generated=True,
             checklist_results=results, checklist_notes=notes,
@@ -738,6 +735,7 @@ print(f"{'─' * 75}")
 criteria_always_pass = []
 criteria_sometimes_fail = []
 criteria_never_triggered = []
+rows = []
 
 for i in range(10):
     used = all_criteria_usage[i]
@@ -754,7 +752,9 @@ for i in range(10):
         status = f"🔴 FALLA {failed}/{used} veces"
         criteria_sometimes_fail.append(i)
     
-    print(f"  {CHECKLIST_NAMES[i]:55s} {status}")
+    rows.append(f"  {CHECKLIST_NAMES[i]:55s} {status}")
+
+print("\n".join(rows))
 
 # Friction analysis
 print(f"\n{'─' * 75}")
@@ -781,18 +781,20 @@ print(f"\n{'─' * 75}")
 print("CLASIFICACIÓN FINAL DE CRITERIOS:")
 print(f"{'─' * 75}")
 
-print("\n  📌 CRITERIOS QUE SIEMPRE SE USAN (esenciales):")
-for i in criteria_always_pass:
-    print(f"     {CHECKLIST_NAMES[i]}")
+output = ["\n  📌 CRITERIOS QUE SIEMPRE SE USAN (esenciales):"]
+output += [f"     {CHECKLIST_NAMES[i]}" for i in criteria_always_pass]
 
-print("\n  🎯 CRITERIOS QUE DETECTAN PROBLEMAS (valor real):")
-for i in criteria_sometimes_fail:
-    print(f"     {CHECKLIST_NAMES[i]} — falló {all_criteria_fail[i]}/{all_criteria_usage[i]}")
+output.append("\n  🎯 CRITERIOS QUE DETECTAN PROBLEMAS (valor real):")
+output += [
+    f"     {CHECKLIST_NAMES[i]} — falló {all_criteria_fail[i]}/{all_criteria_usage[i]}"
+    for i in criteria_sometimes_fail
+]
 
 if criteria_never_triggered:
-    print("\n  ❓ CRITERIOS NO EVALUADOS (pueden sobrar o faltar datos):")
-    for i in criteria_never_triggered:
-        print(f"     {CHECKLIST_NAMES[i]}")
+    output.append("\n  ❓ CRITERIOS NO EVALUADOS (pueden sobrar o faltar datos):")
+    output += [f"     {CHECKLIST_NAMES[i]}" for i in criteria_never_triggered]
+
+print("\n".join(output))
 
 # Where there's still friction
 print(f"\n{'─' * 75}")
@@ -836,3 +838,5 @@ for i, f in enumerate(friction_areas, 1):
 print(f"\n{'=' * 75}")
 print(f"FIN — {total_fixes} fixes evaluados, {len(frictions)} puntos de fricción detectados")
 print(f"{'=' * 75}")
+
+router.close()
@@ -16,33 +16,57 @@ This script demonstrates the complete governed flow:
 import json
 import os
 import sys
+from collections import defaultdict
+from functools import partial
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+os.chdir(_ROOT)
 
 from node_interface.contract import Action, ContractRequest
-from node_interface.router import Router
 
 # ──────────────────────────────────────────────
 # SETUP
 # ──────────────────────────────────────────────
 
-router = Router()
+# Router is imported lazily in main() so importing this module stays cheap.
+router = None
 USER_ID = "admin-001"
 SOURCE = "cli"
 
 SEPARATOR = "=" * 70
 
+# source/user_id are fixed for the whole run; bind them once.
+new_request = partial(ContractRequest, source=SOURCE, user_id=USER_ID)
+
+
+class DDSStore:
+    """In-memory view of dds.json with proposals indexed by status.
+
+    The Router persists through DDSRegistry, so call reload() after any
+    dispatch that mutates proposals.
+    """
+
+    def __init__(self, path: str = "node_dds/dds.json"):
+        self.path = path
+        self.reload()
+
+    def reload(self) -> None:
+        with open(self.path, "r") as f:
+            self.proposals = json.load(f).get("proposals", [])
+        self.by_status = defaultdict(list)
+        for p in self.proposals:
+            self.by_status[p.get("status")].append(p)
+
+
+def section(title):
+    """Print a phase/cycle header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
 
 def dispatch(action: Action, payload: dict = {}, label: str = "") -> str:
     """Helper: dispatch and print result."""
-    req = ContractRequest(
-        action=action,
-        payload=payload,
-        source=SOURCE,
-        user_id=USER_ID,
-    )
-    resp = router.dispatch(req)
+    resp = router.dispatch(new_request(action=action, payload=payload))
     
     status_icon = "✅" if resp.status == "ok" else "❌"
     print(f"\n{status_icon} [{label or action.value}] (audit: {resp.audit_id})")
@@ -56,178 +80,161 @@ def dispatch(action: Action, payload: dict = {}, label: str = "") -> str:
     return resp.message
 
 
-# ──────────────────────────────────────────────
-# PHASE 1: System status (sanity check)
-# ──────────────────────────────────────────────
+def main():
+    global router
+    from node_interface.router import Router
 
-print(SEPARATOR)
-print("PHASE 1: System Status Check")
-print(SEPARATOR)
+    router = Router()
 
-dispatch(Action.SYSTEM_STATUS, label="system_status")
+    # ──────────────────────────────────────────────
+    # PHASE 1: System status (sanity check)
+    # ──────────────────────────────────────────────
 
+    print(SEPARATOR)
+    print("PHASE 1: System Status Check")
+    print(SEPARATOR)
 
-# ──────────────────────────────────────────────
-# PHASE 2: Create 3 DDS proposals
-# ──────────────────────────────────────────────
+    dispatch(Action.SYSTEM_STATUS, label="system_status")
 
-print(f"\n{SEPARATOR}")
-print("PHASE 2: Create 3 DDS Proposals")
-print(SEPARATOR)
 
-# DDS 1: Noop — simple marker (validates basic pipeline)
-dispatch(Action.DDS_NEW, {
-    "project": "FitnessAi",
-    "title": "Add health check endpoint",
-    "description": "Create a /health endpoint that returns system status. This is a marker DDS to validate the pipeline works end-to-end.",
-}, label="dds_new_1")
+    # ──────────────────────────────────────────────
+    # PHASE 2: Create 3 DDS proposals
+    # ──────────────────────────────────────────────
 
-# DDS 2: Noop — logging improvement
-dispatch(Action.DDS_NEW, {
-    "project": "FitnessAi",
-    "title": "Add structured logging",
-    "description": "Implement structured JSON logging for the FitnessAi service to improve observability in production.",
-}, label="dds_new_2")
+    section("PHASE 2: Create 3 DDS Proposals")
 
-# DDS 3: Noop — configuration validation
-dispatch(Action.DDS_NEW, {
-    "project": "ai_system",
-    "title": "Config validation on startup",
-    "description": "Add startup validation for all required environment variables. Log warnings for missing optional vars and fail fast for missing required vars.",
-}, label="dds_new_3")
+    # DDS 1: Noop — simple marker (validates basic pipeline)
+    dispatch(Action.DDS_NEW, {
+        "project": "FitnessAi",
+        "title": "Add health check endpoint",
+        "description": "Create a /health endpoint that returns system status. This is a marker DDS to validate the pipeline works end-to-end.",
+    }, label="dds_new_1")
 
+    # DDS 2: Noop — logging improvement
+    dispatch(Action.DDS_NEW, {
+        "project": "FitnessAi",
+        "title": "Add structured logging",
+        "description": "Implement structured JSON logging for the FitnessAi service to improve observability in production.",
+    }, label="dds_new_2")
 
-# ──────────────────────────────────────────────
-# PHASE 3: List proposed DDS (should show 3)
-# ──────────────────────────────────────────────
+    # DDS 3: Noop — configuration validation
+    dispatch(Action.DDS_NEW, {
+        "project": "ai_system",
+        "title": "Config validation on startup",
+        "description": "Add startup validation for all required environment variables. Log warnings for missing optional vars and fail fast for missing required vars.",
+    }, label="dds_new_3")
 
-print(f"\n{SEPARATOR}")
-print("PHASE 3: List Proposed DDS")
-print(SEPARATOR)
 
-dispatch(Action.DDS_LIST_PROPOSED, label="list_proposed")
+    # ──────────────────────────────────────────────
+    # PHASE 3: List proposed DDS (should show 3)
+    # ──────────────────────────────────────────────
 
+    section("PHASE 3: List Proposed DDS")
 
-# ──────────────────────────────────────────────
-# PHASE 4: Get proposal IDs and approve them
-# ──────────────────────────────────────────────
+    dispatch(Action.DDS_LIST_PROPOSED, label="list_proposed")
 
-print(f"\n{SEPARATOR}")
-print("PHASE 4: Approve All Proposed DDS")
-print(SEPARATOR)
 
-# Load DDS to get IDs
-with open("node_dds/dds.json", "r") as f:
-    dds_data = json.load(f)
+    # ──────────────────────────────────────────────
+    # PHASE 4: Get proposal IDs and approve them
+    # ──────────────────────────────────────────────
 
-proposed_ids = [
-    p["id"] for p in dds_data["proposals"]
-    if p.get("status") == "proposed"
-]
+    section("PHASE 4: Approve All Proposed DDS")
 
-print(f"\n   Found {len(proposed_ids)} proposed DDS: {proposed_ids}")
+    # Load DDS to get IDs
+    store = DDSStore()
+    proposed_ids = [p["id"] for p in store.by_status["proposed"]]
 
-for pid in proposed_ids:
-    dispatch(Action.DDS_APPROVE, {"proposal_id": pid}, label=f"approve_{pid}")
+    print(f"\n   Found {len(proposed_ids)} proposed DDS: {proposed_ids}")
 
+    for pid in proposed_ids:
+        dispatch(Action.DDS_APPROVE, {"proposal_id": pid}, label=f"approve_{pid}")
 
-# ──────────────────────────────────────────────
-# PHASE 5: List all DDS (should show 3 approved)
-# ──────────────────────────────────────────────
 
-print(f"\n{SEPARATOR}")
-print("PHASE 5: Verify All Approved")
-print(SEPARATOR)
+    # ──────────────────────────────────────────────
+    # PHASE 5: List all DDS (should show 3 approved)
+    # ──────────────────────────────────────────────
 
-dispatch(Action.DDS_LIST, label="list_all")
+    section("PHASE 5: Verify All Approved")
 
+    dispatch(Action.DDS_LIST, label="list_all")
 
-# ──────────────────────────────────────────────
-# PHASE 6: Execute all approved DDS
-# ──────────────────────────────────────────────
 
-print(f"\n{SEPARATOR}")
-print("PHASE 6: Execute All DDS")
-print(SEPARATOR)
+    # ──────────────────────────────────────────────
+    # PHASE 6: Execute all approved DDS
+    # ──────────────────────────────────────────────
 
-# Reload to get current approved IDs
-with open("node_dds/dds.json", "r") as f:
-    dds_data = json.load(f)
+    section("PHASE 6: Execute All DDS")
 
-approved_ids = [
-    p["id"] for p in dds_data["proposals"]
-    if p.get("status") == "approved"
-]
+    # Reload to get current approved IDs
+    store.reload()
+    approved_ids = [p["id"] for p in store.by_status["approved"]]
 
-print(f"\n   Found {len(approved_ids)} approved DDS to execute: {approved_ids}")
+    print(f"\n   Found {len(approved_ids)} approved DDS to execute: {approved_ids}")
 
-for did in approved_ids:
-    dispatch(Action.EXECUTE, {"dds_id": did}, label=f"execute_{did}")
+    for did in approved_ids:
+        dispatch(Action.EXECUTE, {"dds_id": did}, label=f"execute_{did}")
 
 
-# ──────────────────────────────────────────────
-# PHASE 7: Check execution status
-# ──────────────────────────────────────────────
+    # ──────────────────────────────────────────────
+    # PHASE 7: Check execution status
+    # ──────────────────────────────────────────────
 
-print(f"\n{SEPARATOR}")
-print("PHASE 7: Execution Status")
-print(SEPARATOR)
+    section("PHASE 7: Execution Status")
 
-dispatch(Action.EXEC_STATUS, label="exec_status")
+    dispatch(Action.EXEC_STATUS, label="exec_status")
 
 
-# ──────────────────────────────────────────────
-# PHASE 8: Dump audit trail
-# ──────────────────────────────────────────────
+    # ──────────────────────────────────────────────
+    # PHASE 8: Dump audit trail
+    # ──────────────────────────────────────────────
 
-print(f"\n{SEPARATOR}")
-print("PHASE 8: Audit Trail")
-print(SEPARATOR)
+    section("PHASE 8: Audit Trail")
 
-audit_file = "audits/contract_audit.jsonl"
-if os.path.exists(audit_file):
-    with open(audit_file, "r") as f:
-        lines = f.readlines()
-    
-    print(f"\n   Total audit entries: {len(lines)}")
-    print(f"   {'─' * 60}")
-    
-    for i, line in enumerate(lines, 1):
-        entry = json.loads(line)
-        icon = "✅" if entry["status"] == "ok" else "❌"
-        print(
-            f"   {i:2d}. {icon} {entry['action']:20s} | "
-            f"source={entry['source']:8s} | "
-            f"user={entry['user_id']:10s} | "
-            f"read_only={entry['read_only']}"
-        )
-else:
-    print("   ⚠️  No audit file found")
+    audit_file = "audits/contract_audit.jsonl"
+    if os.path.exists(audit_file):
+        with open(audit_file, "r") as f:
+            lines = f.readlines()
 
+        print(f"\n   Total audit entries: {len(lines)}")
+        print(f"   {'─' * 60}")
+
+        for i, line in enumerate(lines, 1):
+            entry = json.loads(line)
+            icon = "✅" if entry["status"] == "ok" else "❌"
+            print(
+                f"   {i:2d}. {icon} {entry['action']:20s} | "
+                f"source={entry['source']:8s} | "
+                f"user={entry['user_id']:10s} | "
+                f"read_only={entry['read_only']}"
+            )
+    else:
+        print("   ⚠️  No audit file found")
 
-# ──────────────────────────────────────────────
-# PHASE 9: Dump execution reports
-# ──────────────────────────────────────────────
 
-print(f"\n{SEPARATOR}")
-print("PHASE 9: Execution Reports")
-print(SEPARATOR)
+    # ──────────────────────────────────────────────
+    # PHASE 9: Dump execution reports
+    # ──────────────────────────────────────────────
+
+    section("PHASE 9: Execution Reports")
+
+    with open("node_programmer/reports.json", "r") as f:
+        reports = json.load(f)
+
+    executions = reports.get("executions", [])
+    print(f"\n   Total execution reports: {len(executions)}")
+    print(f"   {'─' * 60}")
 
-with open("node_programmer/reports.json", "r") as f:
-    reports = json.load(f)
+    for i, ex in enumerate(executions, 1):
+        icon = "✅" if ex["status"] == "success" else "❌"
+        print(f"   {i}. {icon} {ex['dds_id']}")
+        print(f"      Type: {ex['action_type']} | Status: {ex['status']}")
+        print(f"      At: {ex['executed_at']}")
+        print(f"      Notes: {ex['notes'][:100]}")
+        print()
 
-executions = reports.get("executions", [])
-print(f"\n   Total execution reports: {len(executions)}")
-print(f"   {'─' * 60}")
+    router.close()
+    section("DONE — Full DDS pipeline executed through Router Contract v1")
 
-for i, ex in enumerate(executions, 1):
-    icon = "✅" if ex["status"] == "success" else "❌"
-    print(f"   {i}. {icon} {ex['dds_id']}")
-    print(f"      Type: {ex['action_type']} | Status: {ex['status']}")
-    print(f"      At: {ex['executed_at']}")
-    print(f"      Notes: {ex['notes'][:100]}")
-    print()
 
-print(f"\n{SEPARATOR}")
-print("DONE — Full DDS pipeline executed through Router Contract v1")
-print(SEPARATOR)
+if __name__ == "__main__":
+    main()
@@ -22,66 +22,245 @@ All actions go through dispatch(). No shortcuts.
 import json
 import os
 import sys
-from datetime import datetime
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import partial
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+os.chdir(_ROOT)
 
 from node_interface.contract import Action, ContractRequest
-from node_interface.router import Router
-from node_worker.reactive_worker import ReactiveWorker
+
+# Router and ReactiveWorker are imported lazily so that importing this
+# module (e.g. during pytest collection) stays cheap and side-effect free.
+router = None
+worker = None
+store = None
+
+# Set by inject_failed_report(), cleared by run_reactive_worker()
+new_failure_injected = False
+
+USER_ID = "reviewer-001"
+SOURCE = "cli"
+SEP = "=" * 70
+AUDIT_FILE = "audits/contract_audit.jsonl"
+_FMT = "%Y-%m-%d %H:%M:%S"
+_AUDIT_ROW = "  {i:2d}. {icon} {action:20s} lvl={lvl:14s} dur={dur}ms ps={ps}".format
+_STATUS_ICON = {"approved": "✅", "rejected": "❌", "proposed": "📋", "executed": "🏁", "failed": "💥"}
+
+# source/user_id are fixed for the whole run; bind them once.
+new_request = partial(ContractRequest, source=SOURCE, user_id=USER_ID)
+
 
 # ──────────────────────────────────────────────
-# SETUP: Clean state
+# FAILURE CYCLE SPECS
 # ──────────────────────────────────────────────
 
-print("=" * 70)
-print("SETUP: Cleaning state for operational test")
-print("=" * 70)
+# Fields shared by every injected code_change DDS; each CycleSpec only
+# carries what differs from this template.
+BASE_CYCLE = {
+    "version": 2,
+    "type": "code_change",
+    "tool": "aider",
+    "constraints": {
+        "max_files_changed": 2,
+        "no_new_dependencies": True,
+        "no_refactor": True
+    },
+    "status": "proposed"
+}
+
+
+@dataclass
+class CycleSpec:
+    """A code_change cycle that is injected, approved, executed and failed."""
+    number: int
+    title: str
+    id: str
+    overrides: dict
+    failure: str
+
+
+CYCLES = {spec.number: spec for spec in [
+    CycleSpec(
+        number=1,
+        title="code_change → env_error (aider not installed)",
+        id="DDS-CYCLE1-ENV",
+        overrides={
+            "project": "FitnessAi",
+            "title": "Add login rate limiting",
+            "description": "Add rate limiting to login endpoint",
+            "goal": "Implement rate limiting on /login to prevent brute force",
+            "instructions": [
+                "Add rate limiter middleware to auth.py",
+                "Limit to 5 attempts per minute per IP",
+                "Return 429 on exceeded"
+            ],
+            "allowed_paths": ["src/", "tests/"],
+            "constraints": {**BASE_CYCLE["constraints"], "max_files_changed": 3},
+        },
+        failure="command not found: aider - Aider tool is not installed in the environment",
+    ),
+    CycleSpec(
+        number=2,
+        title="code_change → dds_error (missing instructions)",
+        id="DDS-CYCLE2-FIELDS",
+        overrides={
+            "project": "FitnessAi",
+            "title": "Fix auth token validation",
+            "description": "Fix token expiration check",
+            "goal": "Fix JWT token expiration validation in auth.py",
+            # NOTE: instructions intentionally missing
+            "allowed_paths": ["src/"],
+        },
+        # What Programmer._validate_dds_v2 would produce
+        failure="Missing or invalid required field: instructions (must be non-empty list)",
+    ),
+    CycleSpec(
+        number=5,
+        title="code_change → dds_error (missing allowed_paths)",
+        id="DDS-CYCLE5-PATHS",
+        overrides={
+            "project": "ai_system",
+            "title": "Add config schema validation",
+            "description": "Validate config.py has all required keys at startup",
+            "goal": "Add schema validation for config.py environment variables",
+            "instructions": [
+                "Create a config schema dict with required/optional keys",
+                "Validate at import time",
+                "Raise clear error for missing required keys"
+            ],
+            # NOTE: allowed_paths intentionally missing
+        },
+        failure="Missing or invalid required field: allowed_paths (must be non-empty list)",
+    ),
+    CycleSpec(
+        number=7,
+        title="code_change → exec_error (timeout)",
+        id="DDS-CYCLE7-TIMEOUT",
+        overrides={
+            "project": "FitnessAi",
+            "title": "Refactor entire test suite",
+            "description": "Major test restructuring",
+            "goal": "Restructure all tests into separate modules",
+            "instructions": [
+                "Move all tests to separate directories",
+                "Create conftest.py with shared fixtures",
+                "Update imports across all test files"
+            ],
+            "allowed_paths": ["tests/"],
+            # NOTE: refactoring allowed in DDS
+            "constraints": {**BASE_CYCLE["constraints"], "max_files_changed": 5, "no_refactor": False},
+        },
+        failure="Timeout after 300s: aider process did not complete within time limit",
+    ),
+]}
+
+
+def now_str(_cache=[None, 0.0]):
+    """Current local time as _FMT, reformatted at most every 0.5s."""
+    t = time.time()
+    if t - _cache[1] > 0.5:
+        _cache[:] = [time.strftime(_FMT, time.localtime(t)), t]
+    return _cache[0]
+
+
+_json_cache = {}
+
+
+def _stat_key(path):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def load_json_cached(path):
+    """json.load() that reuses the parsed result while the file is unchanged.
+
+    Keyed on (mtime_ns, size) so rewrites by the Router or ReactiveWorker
+    invalidate the entry.
+    """
+    key = _stat_key(path)
+    hit = _json_cache.get(path)
+    if hit and hit[0] == key:
+        return hit[1]
+    with open(path, "r") as f:
+        data = json.load(f)
+    _json_cache[path] = (key, data)
+    return data
 
-# Reset dds.json
-with open("node_dds/dds.json", "w") as f:
-    json.dump({"proposals": []}, f, indent=2)
-print("  ✓ dds.json reset")
 
-# Reset reports.json
-with open("node_programmer/reports.json", "w") as f:
-    json.dump({"executions": []}, f, indent=2)
-print("  ✓ reports.json reset")
+def dump_json_cached(path, data):
+    """Write data as JSON and keep it cached, so our own writes are never re-parsed."""
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+    _json_cache[path] = (_stat_key(path), data)
 
-# Clear audit (fresh test)
-audit_file = "audits/contract_audit.jsonl"
-with open(audit_file, "w") as f:
-    pass
-print("  ✓ audit trail cleared")
 
-router = Router()
-worker = ReactiveWorker()
-USER_ID = "reviewer-001"
-SOURCE = "cli"
-SEP = "=" * 70
+class DDSStore:
+    """In-memory view of dds.json with proposals indexed by status and title.
+
+    append() keeps the file and the indexes in sync. The Router persists
+    through DDSRegistry, so call reload() after any dispatch that mutates
+    proposals.
+    """
+
+    def __init__(self, path="node_dds/dds.json"):
+        self.path = path
+        self.reload()
+
+    def reload(self):
+        proposals = load_json_cached(self.path).get("proposals", [])
+        self.proposals = []
+        self.by_status = defaultdict(list)
+        self.by_title = defaultdict(list)
+        for p in proposals:
+            self._index(p)
+
+    def _index(self, proposal):
+        self.proposals.append(proposal)
+        self.by_status[proposal.get("status")].append(proposal)
+        self.by_title[proposal.get("title")].append(proposal)
+
+    def append(self, proposal):
+        self._index(proposal)
+        dump_json_cached(self.path, {"proposals": self.proposals})
+
+
+def section(title):
+    """Print a phase/cycle header framed by separator lines."""
+    print(f"\n{SEP}\n{title}\n{SEP}")
 
 
 def dispatch(action, payload=None, label=""):
     """Dispatch through Router and print result."""
-    req = ContractRequest(
-        action=action,
-        payload=payload or {},
-        source=SOURCE,
-        user_id=USER_ID,
-    )
-    resp = router.dispatch(req)
+    resp = router.dispatch(new_request(action=action, payload=payload or {}))
     icon = "✅" if resp.status == "ok" else "❌"
     print(f"  {icon} [{label or action.value}] status={resp.status}")
-    for line in resp.message.split("\n")[:6]:  # cap output
+    lines = resp.message.split("\n", 6)  # only split what we print
+    for line in lines[:6]:  # cap output
         print(f"     {line}")
-    if len(resp.message.split("\n")) > 6:
-        print(f"     ... ({len(resp.message.split(chr(10)))} lines total)")
+    if len(lines) > 6:
+        total = resp.message.count("\n") + 1
+        print(f"     ... ({total} lines total)")
     return resp
 
 
 def run_reactive_worker(label=""):
-    """Run ReactiveWorker and print result."""
+    """Run ReactiveWorker and print result.
+
+    Skipped when no failure has been injected since the last run — the
+    worker would only rescan reports.json and find nothing new.
+    """
+    global worker, new_failure_injected
+    if not new_failure_injected:
+        print(f"  ⏭️  ReactiveWorker skipped ({label}): no new failure reported")
+        return None
+    new_failure_injected = False
+    if worker is None:
+        from node_worker.reactive_worker import ReactiveWorker
+        worker = ReactiveWorker()
     print(f"  🔄 Running ReactiveWorker... ({label})")
     result = worker.run()
     print(f"     Status: {result['status']}")
@@ -94,324 +273,249 @@ def inject_dds_directly(dds_dict):
     """Inject a raw DDS into dds.json (simulates DDS created by todo_to_dds
     or external process). This is needed because dds_new only creates
     basic proposals without type/version/instructions/constraints fields."""
-    with open("node_dds/dds.json", "r") as f:
-        data = json.load(f)
-    data["proposals"].append(dds_dict)
-    with open("node_dds/dds.json", "w") as f:
-        json.dump(data, f, indent=2)
+    store.reload()  # pick up writes made by the Router/ReactiveWorker
+    store.append(dds_dict)
     print(f"  📥 Injected DDS: {dds_dict['id']} (type={dds_dict.get('type')})")
 
 
 def inject_failed_report(dds_id, action_type, error_msg):
     """Inject a failed execution report into reports.json.
-    Simulates what Programmer would write on failure."""
-    with open("node_programmer/reports.json", "r") as f:
-        data = json.load(f)
+    Simulates what Programmer would write on failure.
+
+    reports.json stays a single JSON object (FailureAnalyzer and Programmer
+    parse it between cycles), so it is rewritten in full; the read side is
+    served from the in-memory copy kept by dump_json_cached()."""
+    data = load_json_cached("node_programmer/reports.json")
     data["executions"].append({
         "dds_id": dds_id,
         "action_type": action_type,
         "status": "failed",
-        "executed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "executed_at": now_str(),
         "notes": error_msg,
     })
-    with open("node_programmer/reports.json", "w") as f:
-        json.dump(data, f, indent=2)
+    global new_failure_injected
+    dump_json_cached("node_programmer/reports.json", data)
+    new_failure_injected = True
     print(f"  📥 Injected failed report for {dds_id}")
 
 
-# ══════════════════════════════════════════════
-# CYCLE 1: code_change DDS → aider not installed (env_error)
-# ══════════════════════════════════════════════
+def run_failure_cycle(spec):
+    """Inject a code_change DDS, approve and execute it through dispatch(),
+    then record its failure and run the ReactiveWorker."""
+    section(f"CYCLE {spec.number}: {spec.title}")
 
-print(f"\n{SEP}")
-print("CYCLE 1: code_change → env_error (aider not installed)")
-print(SEP)
+    inject_dds_directly({"id": spec.id, **BASE_CYCLE, **spec.overrides, "created_at": now_str()})
+    dispatch(Action.DDS_APPROVE, {"proposal_id": spec.id}, "approve")
+    dispatch(Action.EXECUTE, {"dds_id": spec.id}, "execute")
 
-cycle1_id = "DDS-CYCLE1-ENV"
-inject_dds_directly({
-    "id": cycle1_id,
-    "version": 2,
-    "type": "code_change",
-    "project": "FitnessAi",
-    "title": "Add login rate limiting",
-    "description": "Add rate limiting to login endpoint",
-    "goal": "Implement rate limiting on /login to prevent brute force",
-    "instructions": [
-        "Add rate limiter middleware to auth.py",
-        "Limit to 5 attempts per minute per IP",
-        "Return 429 on exceeded"
-    ],
-    "allowed_paths": ["src/", "tests/"],
-    "tool": "aider",
-    "constraints": {
-        "max_files_changed": 3,
-        "no_new_dependencies": True,
-        "no_refactor": True
-    },
-    "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-    "status": "proposed"
-})
+    # Inject the failed report that Programmer would have written
+    # (since the Router catches ProgrammerError before the report gets saved in some cases)
+    inject_failed_report(spec.id, BASE_CYCLE["type"], spec.failure)
+    run_reactive_worker(f"after cycle {spec.number}")
 
-# Approve through dispatch
-dispatch(Action.DDS_APPROVE, {"proposal_id": cycle1_id}, "approve")
 
-# Execute through dispatch — will fail because aider is not installed
-dispatch(Action.EXECUTE, {"dds_id": cycle1_id}, "execute")
+# ──────────────────────────────────────────────
+# SETUP: Clean state
+# ──────────────────────────────────────────────
 
-# Inject the failed report that Programmer would have written
-# (since the Router catches ProgrammerError before the report gets saved in some cases)
-inject_failed_report(cycle1_id, "code_change",
-    "command not found: aider - Aider tool is not installed in the environment")
+def reset_state():
+    """Reset dds.json, reports.json and the audit trail for a fresh run."""
+    print("=" * 70)
+    print("SETUP: Cleaning state for operational test")
+    print("=" * 70)
 
-# Run reactive worker
-run_reactive_worker("after cycle 1")
+    # Reset dds.json
+    with open("node_dds/dds.json", "w") as f:
+        json.dump({"proposals": []}, f, indent=2)
+    print("  ✓ dds.json reset")
 
+    # Reset reports.json
+    with open("node_programmer/reports.json", "w") as f:
+        json.dump({"executions": []}, f, indent=2)
+    print("  ✓ reports.json reset")
 
-# ══════════════════════════════════════════════
-# CYCLE 2: code_change DDS → missing instructions field (dds_error)
-# ══════════════════════════════════════════════
+    # Clear audit (fresh test)
+    with open(AUDIT_FILE, "w") as f:
+        pass
+    print("  ✓ audit trail cleared")
 
-print(f"\n{SEP}")
-print("CYCLE 2: code_change → dds_error (missing instructions)")
-print(SEP)
 
-cycle2_id = "DDS-CYCLE2-FIELDS"
-inject_dds_directly({
-    "id": cycle2_id,
-    "version": 2,
-    "type": "code_change",
-    "project": "FitnessAi",
-    "title": "Fix auth token validation",
-    "description": "Fix token expiration check",
-    "goal": "Fix JWT token expiration validation in auth.py",
-    # NOTE: instructions intentionally missing
-    "allowed_paths": ["src/"],
-    "tool": "aider",
-    "constraints": {
-        "max_files_changed": 2,
-        "no_new_dependencies": True,
-        "no_refactor": True
-    },
-    "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-    "status": "proposed"
-})
+def main():
+    global router, store
+    from node_interface.router import Router
 
-dispatch(Action.DDS_APPROVE, {"proposal_id": cycle2_id}, "approve")
-dispatch(Action.EXECUTE, {"dds_id": cycle2_id}, "execute")
+    reset_state()
+    router = Router()
+    store = DDSStore()
 
-# Inject failed report simulating what Programmer._validate_dds_v2 would produce
-inject_failed_report(cycle2_id, "code_change",
-    "Missing or invalid required field: instructions (must be non-empty list)")
+    # ══════════════════════════════════════════════
+    # CYCLE 1: code_change DDS → aider not installed (env_error)
+    # ══════════════════════════════════════════════
 
-run_reactive_worker("after cycle 2")
+    run_failure_cycle(CYCLES[1])
 
 
-# ══════════════════════════════════════════════
-# CYCLE 3: noop DDS — success baseline (no fix expected)
-# ══════════════════════════════════════════════
+    # ══════════════════════════════════════════════
+    # CYCLE 2: code_change DDS → missing instructions field (dds_error)
+    # ══════════════════════════════════════════════
 
-print(f"\n{SEP}")
-print("CYCLE 3: noop → success (baseline, no fix expected)")
-print(SEP)
+    run_failure_cycle(CYCLES[2])
 
-cycle3_id = "DDS-CYCLE3-NOOP"
-dispatch(Action.DDS_NEW, {
-    "project": "FitnessAi",
-    "title": "Pipeline validation marker",
-    "description": "Noop to validate pipeline is functional",
-}, "create")
 
-# Get the actual ID assigned
-with open("node_dds/dds.json", "r") as f:
-    data = json.load(f)
-for p in data["proposals"]:
-    if p.get("title") == "Pipeline validation marker" and p.get("status") == "proposed":
-        cycle3_id = p["id"]
-        break
+    # ══════════════════════════════════════════════
+    # CYCLE 3: noop DDS — success baseline (no fix expected)
+    # ══════════════════════════════════════════════
 
-dispatch(Action.DDS_APPROVE, {"proposal_id": cycle3_id}, "approve")
-dispatch(Action.EXECUTE, {"dds_id": cycle3_id}, "execute")
+    section("CYCLE 3: noop → success (baseline, no fix expected)")
 
-# No need to run reactive worker — success case
+    cycle3_id = "DDS-CYCLE3-NOOP"
+    dispatch(Action.DDS_NEW, {
+        "project": "FitnessAi",
+        "title": "Pipeline validation marker",
+        "description": "Noop to validate pipeline is functional",
+    }, "create")
 
+    # Get the actual ID assigned
+    store.reload()
+    for p in store.by_title["Pipeline validation marker"]:
+        if p.get("status") == "proposed":
+            cycle3_id = p["id"]
+            break
 
-# ══════════════════════════════════════════════
-# CYCLE 4: Execute non-existent DDS ID (dds_error: not found)
-# ══════════════════════════════════════════════
+    dispatch(Action.DDS_APPROVE, {"proposal_id": cycle3_id}, "approve")
+    dispatch(Action.EXECUTE, {"dds_id": cycle3_id}, "execute")
 
-print(f"\n{SEP}")
-print("CYCLE 4: Execute non-existent ID (dds_error)")
-print(SEP)
+    # No need to run reactive worker — success case
 
-dispatch(Action.EXECUTE, {"dds_id": "DDS-DOES-NOT-EXIST"}, "execute_phantom")
 
-# No report injected — the Router catches this before Programmer runs
-# ReactiveWorker won't find any new failures
-run_reactive_worker("after cycle 4")
+    # ══════════════════════════════════════════════
+    # CYCLE 4: Execute non-existent DDS ID (dds_error: not found)
+    # ══════════════════════════════════════════════
 
+    section("CYCLE 4: Execute non-existent ID (dds_error)")
 
-# ══════════════════════════════════════════════
-# CYCLE 5: code_change DDS → missing allowed_paths (dds_error)
-# ══════════════════════════════════════════════
+    dispatch(Action.EXECUTE, {"dds_id": "DDS-DOES-NOT-EXIST"}, "execute_phantom")
 
-print(f"\n{SEP}")
-print("CYCLE 5: code_change → dds_error (missing allowed_paths)")
-print(SEP)
+    # No report injected — the Router catches this before Programmer runs,
+    # so the ReactiveWorker run is skipped
+    run_reactive_worker("after cycle 4")
 
-cycle5_id = "DDS-CYCLE5-PATHS"
-inject_dds_directly({
-    "id": cycle5_id,
-    "version": 2,
-    "type": "code_change",
-    "project": "ai_system",
-    "title": "Add config schema validation",
-    "description": "Validate config.py has all required keys at startup",
-    "goal": "Add schema validation for config.py environment variables",
-    "instructions": [
-        "Create a config schema dict with required/optional keys",
-        "Validate at import time",
-        "Raise clear error for missing required keys"
-    ],
-    # NOTE: allowed_paths intentionally missing
-    "tool": "aider",
-    "constraints": {
-        "max_files_changed": 2,
-        "no_new_dependencies": True,
-        "no_refactor": True
-    },
-    "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-    "status": "proposed"
-})
 
-dispatch(Action.DDS_APPROVE, {"proposal_id": cycle5_id}, "approve")
-dispatch(Action.EXECUTE, {"dds_id": cycle5_id}, "execute")
+    # ══════════════════════════════════════════════
+    # CYCLE 5: code_change DDS → missing allowed_paths (dds_error)
+    # ══════════════════════════════════════════════
 
-inject_failed_report(cycle5_id, "code_change",
-    "Missing or invalid required field: allowed_paths (must be non-empty list)")
+    run_failure_cycle(CYCLES[5])
 
-run_reactive_worker("after cycle 5")
 
+    # ══════════════════════════════════════════════
+    # CYCLE 6: Re-execute already executed DDS (dds_error)
+    # ══════════════════════════════════════════════
 
-# ══════════════════════════════════════════════
-# CYCLE 6: Re-execute already executed DDS (dds_error)
-# ══════════════════════════════════════════════
+    section("CYCLE 6: Re-execute already executed DDS")
 
-print(f"\n{SEP}")
-print("CYCLE 6: Re-execute already executed DDS")
-print(SEP)
+    # cycle3_id was already executed successfully in Cycle 3
+    dispatch(Action.EXECUTE, {"dds_id": cycle3_id}, "re-execute")
 
-# cycle3_id was already executed successfully in Cycle 3
-dispatch(Action.EXECUTE, {"dds_id": cycle3_id}, "re-execute")
+    # No new failure in reports — Router handles this before Programmer,
+    # so the ReactiveWorker run is skipped
+    run_reactive_worker("after cycle 6")
 
-# No new failure in reports — Router handles this before Programmer
-run_reactive_worker("after cycle 6")
 
+    # ══════════════════════════════════════════════
+    # CYCLE 7: code_change DDS → timeout (exec_error)
+    # ══════════════════════════════════════════════
 
-# ══════════════════════════════════════════════
-# CYCLE 7: code_change DDS → timeout (exec_error)
-# ══════════════════════════════════════════════
+    run_failure_cycle(CYCLES[7])
 
-print(f"\n{SEP}")
-print("CYCLE 7: code_change → exec_error (timeout)")
-print(SEP)
 
-cycle7_id = "DDS-CYCLE7-TIMEOUT"
-inject_dds_directly({
-    "id": cycle7_id,
-    "version": 2,
-    "type": "code_change",
-    "project": "FitnessAi",
-    "title": "Refactor entire test suite",
-    "description": "Major test restructuring",
-    "goal": "Restructure all tests into separate modules",
-    "instructions": [
-        "Move all tests to separate directories",
-        "Create conftest.py with shared fixtures",
-        "Update imports across all test files"
-    ],
-    "allowed_paths": ["tests/"],
-    "tool": "aider",
-    "constraints": {
-        "max_files_changed": 5,
-        "no_new_dependencies": True,
-        "no_refactor": False  # NOTE: refactoring allowed in DDS
-    },
-    "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-    "status": "proposed"
-})
-
-dispatch(Action.DDS_APPROVE, {"proposal_id": cycle7_id}, "approve")
-dispatch(Action.EXECUTE, {"dds_id": cycle7_id}, "execute")
-
-inject_failed_report(cycle7_id, "code_change",
-    "Timeout after 300s: aider process did not complete within time limit")
-
-run_reactive_worker("after cycle 7")
-
-
-# ══════════════════════════════════════════════
-# FINAL DUMP: All data for human review
-# ══════════════════════════════════════════════
-
-print(f"\n{'=' * 70}")
-print("FINAL STATE DUMP FOR HUMAN REVIEW")
-print("=" * 70)
-
-# 1. DDS Registry
-print(f"\n{'─' * 70}")
-print("DDS REGISTRY (node_dds/dds.json)")
-print("─" * 70)
-with open("node_dds/dds.json", "r") as f:
-    data = json.load(f)
-for i, p in enumerate(data["proposals"], 1):
-    ptype = p.get("type", "simple")
-    icon = {"approved": "✅", "rejected": "❌", "proposed": "📋", "executed": "🏁", "failed": "💥"}.get(p.get("status"), "⏳")
-    print(f"\n  {i}. {icon} {p['id']}")
-    print(f"     Type: {ptype} | Project: {p.get('project')} | Status: {p.get('status')}")
-    print(f"     Title: {p.get('title')}")
-    if p.get("source_dds"):
-        print(f"     source_dds: {p['source_dds']}")
-    if p.get("error_context"):
-        ec = p["error_context"]
-        print(f"     error_context.original_dds: {ec.get('original_dds')}")
-        print(f"     error_context.error_message: {ec.get('error_message', '')[:120]}")
-    if p.get("constraints"):
-        c = p["constraints"]
-        print(f"     constraints: max_files={c.get('max_files_changed')}, no_deps={c.get('no_new_dependencies')}, no_refactor={c.get('no_refactor')}")
-    if p.get("allowed_paths"):
-        print(f"     allowed_paths: {p['allowed_paths']}")
-
-# 2. Execution reports
-print(f"\n{'─' * 70}")
-print("EXECUTION REPORTS (node_programmer/reports.json)")
-print("─" * 70)
-with open("node_programmer/reports.json", "r") as f:
-    reports = json.load(f)
-for i, ex in enumerate(reports.get("executions", []), 1):
-    icon = "✅" if ex["status"] == "success" else "❌"
-    print(f"\n  {i}. {icon} {ex['dds_id']}")
-    print(f"     Type: {ex['action_type']} | Status: {ex['status']}")
-    print(f"     Notes: {ex['notes'][:150]}")
-
-# 3. Audit trail
-print(f"\n{'─' * 70}")
-print("AUDIT TRAIL (audits/contract_audit.jsonl)")
-print("─" * 70)
-if os.path.exists(audit_file):
-    with open(audit_file, "r") as f:
-        lines = f.readlines()
-    print(f"\n  Total entries: {len(lines)}")
-    for i, line in enumerate(lines, 1):
-        entry = json.loads(line)
-        icon = "✅" if entry["status"] == "ok" else "❌"
-        lvl = entry.get("level", "?")
+    # ══════════════════════════════════════════════
+    # FINAL DUMP: All data for human review
+    # ══════════════════════════════════════════════
+
+    print(f"\n{'=' * 70}")
+    print("FINAL STATE DUMP FOR HUMAN REVIEW")
+    print("=" * 70)
+
+    # Index reports and audit entries by DDS id once, then emit one block per
+    # DDS with everything that refers to it.
+    store.reload()
+    reports = load_json_cached("node_programmer/reports.json").get("executions", [])
+    reports_by_id = defaultdict(list)
+    for ex in reports:
+        reports_by_id[ex["dds_id"]].append(ex)
+
+    audits = []
+    if os.path.exists(AUDIT_FILE):
+        with open(AUDIT_FILE, "r") as f:
+            audits = [json.loads(line) for line in f]
+    audits_by_id = defaultdict(list)
+    unlinked_audits = []
+    for i, entry in enumerate(audits, 1):
         ps = entry.get("payload_summary", {})
+        ref = ps.get("dds_id") or ps.get("proposal_id")
+        (audits_by_id[ref] if ref else unlinked_audits).append((i, entry))
+
+    def print_audit_row(i, entry):
+        icon = "✅" if entry["status"] == "ok" else "❌"
+        print(_AUDIT_ROW(
+            i=i, icon=icon, action=entry["action"], lvl=entry.get("level", "?"),
+            dur=entry.get("duration_ms", "?"), ps=entry.get("payload_summary", {}),
+        ))
         ed = entry.get("error_detail", "")
-        dur = entry.get("duration_ms", "?")
-        print(f"  {i:2d}. {icon} {entry['action']:20s} lvl={lvl:14s} dur={dur}ms ps={ps}")
         if ed:
             print(f"      error_detail: {ed[:120]}")
 
-print(f"\n{'=' * 70}")
-print("OPERATIONAL TEST COMPLETE — Ready for human review")
-print("=" * 70)
+    print(f"\n  Sources: node_dds/dds.json ({len(store.proposals)} DDS), "
+          f"node_programmer/reports.json ({len(reports)} reports), "
+          f"{AUDIT_FILE} ({len(audits)} entries)")
+
+    for i, p in enumerate(store.proposals, 1):
+        ptype = p.get("type", "simple")
+        icon = _STATUS_ICON.get(p.get("status"), "⏳")
+        print(f"\n{'─' * 70}")
+        print(f"  {i}. {icon} {p['id']}")
+        print(f"     Type: {ptype} | Project: {p.get('project')} | Status: {p.get('status')}")
+        print(f"     Title: {p.get('title')}")
+        if p.get("source_dds"):
+            print(f"     source_dds: {p['source_dds']}")
+        if p.get("error_context"):
+            ec = p["error_context"]
+            print(f"     error_context.original_dds: {ec.get('original_dds')}")
+            print(f"     error_context.error_message: {ec.get('error_message', '')[:120]}")
+        if p.get("constraints"):
+            c = p["constraints"]
+            print(f"     constraints: max_files={c.get('max_files_changed')}, no_deps={c.get('no_new_dependencies')}, no_refactor={c.get('no_refactor')}")
+        if p.get("allowed_paths"):
+            print(f"     allowed_paths: {p['allowed_paths']}")
+
+        for ex in reports_by_id.pop(p["id"], ()):
+            icon = "✅" if ex["status"] == "success" else "❌"
+            print(f"     {icon} report: {ex['action_type']} | {ex['status']}")
+            print(f"        Notes: {ex['notes'][:150]}")
+        for row in audits_by_id.pop(p["id"], ()):
+            print_audit_row(*row)
+
+    # Anything that never resolved to a registered DDS (phantom ids,
+    # creation requests, read-only queries)
+    orphan_reports = [ex for exs in reports_by_id.values() for ex in exs]
+    unlinked_audits += [row for rows in audits_by_id.values() for row in rows]
+    if orphan_reports or unlinked_audits:
+        print(f"\n{'─' * 70}")
+        print("NOT LINKED TO A REGISTERED DDS")
+        print("─" * 70)
+        for ex in orphan_reports:
+            icon = "✅" if ex["status"] == "success" else "❌"
+            print(f"\n  {icon} report {ex['dds_id']}: {ex['action_type']} | {ex['status']}")
+            print(f"     Notes: {ex['notes'][:150]}")
+        for row in sorted(unlinked_audits, key=lambda r: r[0]):
+            print_audit_row(*row)
+
+    router.close()
+
+    print(f"\n{'=' * 70}")
+    print("OPERATIONAL TEST COMPLETE — Ready for human review")
+    print("=" * 70)
+
+if __name__ == "__main__":
+    main()
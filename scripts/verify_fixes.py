@@ -9,19 +9,41 @@ Runs the same 7 cycles as the original test but verifies:
   P5: Error category is captured in audit error_detail
 """
 
+import io
 import json
 import os
+import re
 import sys
 import time
-from datetime import datetime
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# orjson is optional; fall back to the stdlib parser/serializer
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(data):
+        return json.dumps(data, separators=(",", ":")).encode()
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+os.chdir(_ROOT)
 
 from node_interface.contract import Action, ContractRequest
 from node_interface.router import Router
 from node_worker.reactive_worker import ReactiveWorker
 
+DDS_FILE = "node_dds/dds.json"
+REPORTS_FILE = "node_programmer/reports.json"
+AUDIT_FILE = "audits/contract_audit.jsonl"
+
+# Any of the error categories the Router writes into audit error_detail
+_ERROR_CATEGORY_RE = re.compile(
+    r"dds_error|env_error|exec_error|payload_invalid|source_denied|handler_exception"
+)
+
 # ──────────────────────────────────────────────
 # SETUP: Clean state
 # ──────────────────────────────────────────────
@@ -30,30 +52,62 @@ print("=" * 70)
 print("VERIFICATION TEST: Confirming all 5 problems are fixed")
 print("=" * 70)
 
-with open("node_dds/dds.json", "w") as f:
-    json.dump({"proposals": []}, f, indent=2)
-with open("node_programmer/reports.json", "w") as f:
-    json.dump({"executions": []}, f, indent=2)
-with open("audits/contract_audit.jsonl", "w") as f:
+with open(DDS_FILE, "w") as f:
+    json.dump({"proposals": []}, f, separators=(",", ":"))
+with open(REPORTS_FILE, "w") as f:
+    json.dump({"executions": []}, f, separators=(",", ":"))
+with open(AUDIT_FILE, "w") as f:
     pass
 
-router = Router()
+# Audit lines are buffered in memory and written in one append by
+# flush_audit(). Set VERIFY_BUFFER_AUDIT=0 to keep per-dispatch writes.
+_audit_buffer = io.StringIO() if os.getenv("VERIFY_BUFFER_AUDIT", "1") != "0" else None
+router = Router(audit_sink=_audit_buffer)
 worker = ReactiveWorker()
 USER_ID = "verifier-001"
 SOURCE = "cli"
 SEP = "=" * 70
 PASS = 0
 FAIL = 0
+# VERIFY_FAIL_FAST=1 stops at the first failed check
+FAIL_FAST = bool(int(os.getenv("VERIFY_FAIL_FAST", "0")))
+
+
+# (ok, name, detail) per check, written out by flush_checks() once per TEST block
+_results = []
 
 
 def check(name, condition, detail=""):
     global PASS, FAIL
-    if condition:
+    ok = bool(condition)
+    if ok:
         PASS += 1
-        print(f"  ✅ PASS: {name}")
     else:
         FAIL += 1
-        print(f"  ❌ FAIL: {name} — {detail}")
+    _results.append((ok, name, detail))
+    if not ok and FAIL_FAST:
+        flush_checks()
+        flush_audit()
+        print(f"\n{SEP}")
+        print(f"VERIFICATION ABORTED (VERIFY_FAIL_FAST): {PASS} passed, {FAIL} failed")
+        print(SEP)
+        sys.exit(1)
+    return ok
+
+
+def flush_checks():
+    if _results:
+        sys.stdout.write("\n".join(
+            f"  ✅ PASS: {name}" if ok else f"  ❌ FAIL: {name} — {detail}"
+            for ok, name, detail in _results
+        ) + "\n")
+        _results.clear()
+
+
+def _now_str():
+    """Local time as YYYY-MM-DD HH:MM:SS, formatted without strftime."""
+    t = time.localtime()
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
 
 
 def dispatch(action, payload=None, label=""):
@@ -61,37 +115,76 @@ def dispatch(action, payload=None, label=""):
     return router.dispatch(req)
 
 
+# Parsed dds.json / reports.json, keyed by path. An entry is reused while the
+# file's (mtime_ns, size) is unchanged, so injections only re-read a file
+# after the Router or Worker has written to it.
+_json_state = {}
+
+
+def _load_state(path):
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _json_state.get(path)
+    if cached is None or cached[0] != key:
+        with open(path, "rb") as f:
+            cached = _json_state[path] = (key, _loads(f.read()))
+    return cached[1]
+
+
+def _write_state(path, data):
+    with open(path, "wb") as f:
+        f.write(_dumps(data))
+    st = os.stat(path)
+    _json_state[path] = ((st.st_mtime_ns, st.st_size), data)
+
+
+def read_dds():
+    """Current dds.json contents; only re-parsed after the file changes."""
+    return _load_state(DDS_FILE)
+
+
 def inject_dds(dds_dict):
-    with open("node_dds/dds.json", "r") as f:
-        data = json.load(f)
+    data = _load_state(DDS_FILE)
     data["proposals"].append(dds_dict)
-    with open("node_dds/dds.json", "w") as f:
-        json.dump(data, f, indent=2)
+    _write_state(DDS_FILE, data)
 
 
 def inject_failed_report(dds_id, action_type, error_msg):
-    with open("node_programmer/reports.json", "r") as f:
-        data = json.load(f)
+    data = _load_state(REPORTS_FILE)
     data["executions"].append({
         "dds_id": dds_id,
         "action_type": action_type,
         "status": "failed",
-        "executed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "executed_at": _now_str(),
         "notes": error_msg,
     })
-    with open("node_programmer/reports.json", "w") as f:
-        json.dump(data, f, indent=2)
+    _write_state(REPORTS_FILE, data)
 
 
-def get_last_audit():
-    with open("audits/contract_audit.jsonl", "r") as f:
-        lines = f.readlines()
-    return json.loads(lines[-1]) if lines else {}
+def flush_audit():
+    if _audit_buffer is not None and _audit_buffer.tell():
+        with open(AUDIT_FILE, "a", encoding="utf-8") as f:
+            f.write(_audit_buffer.getvalue())
+        _audit_buffer.seek(0)
+        _audit_buffer.truncate()
 
 
-def get_all_audits():
-    with open("audits/contract_audit.jsonl", "r") as f:
-        return [json.loads(line) for line in f.readlines()]
+def get_last_audit():
+    """Parse only the last audit line, read from the end of the file."""
+    flush_audit()
+    with open(AUDIT_FILE, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        back = 4096
+        while True:
+            back = min(size, back)
+            f.seek(size - back)
+            tail = f.read(back).rstrip(b"\n")
+            nl = tail.rfind(b"\n")
+            if nl != -1 or back == size:
+                break
+            back *= 2  # last line is longer than the window
+    line = tail[nl + 1:]
+    return _loads(line) if line else {}
 
 
 # ══════════════════════════════════════════════
@@ -115,7 +208,7 @@ inject_dds({
     "allowed_paths": ["src/", "tests/"],
     "tool": "aider",
     "constraints": {"max_files_changed": 3, "no_new_dependencies": True, "no_refactor": True},
-    "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    "created_at": _now_str(),
     "status": "approved"
 })
 
@@ -125,8 +218,7 @@ inject_failed_report(test1_id, "code_change",
 result = worker.run()
 
 # Read dds.json and find the fix
-with open("node_dds/dds.json", "r") as f:
-    data = json.load(f)
+data = read_dds()
 
 fix_proposals = [p for p in data["proposals"] if p.get("type") == "code_fix"]
 check("Fix was generated", len(fix_proposals) == 1,
@@ -155,6 +247,8 @@ if fix_proposals:
           f"Got: {fix.get('allowed_paths')}")
     check("type is code_fix", fix.get("type") == "code_fix")
 
+flush_checks()
+
 
 # ══════════════════════════════════════════════
 # TEST 2: P2 — Fix IDs are unique
@@ -178,18 +272,17 @@ inject_dds({
     "allowed_paths": ["src/"],
     "tool": "aider",
     "constraints": {"max_files_changed": 2, "no_new_dependencies": True, "no_refactor": True},
-    "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    "created_at": _now_str(),
     "status": "approved"
 })
 
 inject_failed_report(test2_id, "code_change", "ImportError: No module named 'structlog'")
 
-# Need fresh worker for fresh FailureAnalyzer state
-worker2 = ReactiveWorker()
-result2 = worker2.run()
+# Fresh FailureAnalyzer state, same worker
+worker.failure_analyzer.reset_processed()
+result2 = worker.run()
 
-with open("node_dds/dds.json", "r") as f:
-    data = json.load(f)
+data = read_dds()
 
 fix_proposals = [p for p in data["proposals"] if p.get("type") == "code_fix"]
 fix_ids = [p["id"] for p in fix_proposals]
@@ -202,6 +295,8 @@ check("Fix IDs have microseconds (6 digits at end)",
       all(len(fid.split("-")[-1]) == 6 and fid.split("-")[-1].isdigit() for fid in fix_ids),
       f"IDs: {fix_ids}")
 
+flush_checks()
+
 
 # ══════════════════════════════════════════════
 # TEST 3: P3 — FailureAnalyzer doesn't re-propose
@@ -218,12 +313,13 @@ check("Worker returns no_failures on re-run",
       f"Got: status={result3['status']}, proposals={result3['proposals_generated']}")
 
 # Verify no new fixes were added
-with open("node_dds/dds.json", "r") as f:
-    data = json.load(f)
+data = read_dds()
 fix_count_after = len([p for p in data["proposals"] if p.get("type") == "code_fix"])
 check("No duplicate fixes created", fix_count_after == 2,
       f"Expected 2, got {fix_count_after}")
 
+flush_checks()
+
 
 # ══════════════════════════════════════════════
 # TEST 4: P4 — Business errors produce status=error
@@ -251,7 +347,7 @@ inject_dds({
     "project": "ai_system",
     "title": "Test not approved",
     "description": "Should fail",
-    "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    "created_at": _now_str(),
     "status": "proposed"
 })
 
@@ -264,30 +360,29 @@ check("Audit for not-approved has error_detail", "dds_error" in audit4b.get("err
       f"Got: {audit4b.get('error_detail', '')[:100]}")
 
 # 4c: Re-execute already executed DDS
-test4c_id = "DDS-TEST4C-REEXEC"
-dispatch(Action.DDS_NEW, {
+resp4c_new = dispatch(Action.DDS_NEW, {
     "project": "FitnessAi",
     "title": "Re-exec test",
     "description": "Test re-execution",
 })
+# Re-exec checks need the new proposal; skip them if DDS_NEW did not return
+# one (registry errors come back as status=ok with no data)
+test4c_id = (resp4c_new.data or {}).get("proposal_id")
+if check("Re-exec DDS created", resp4c_new.status == "ok" and test4c_id,
+         f"Got: {resp4c_new.status}, proposal_id={test4c_id} — {resp4c_new.message[:100]}"):
 
-with open("node_dds/dds.json", "r") as f:
-    data = json.load(f)
-for p in data["proposals"]:
-    if p.get("title") == "Re-exec test" and p.get("status") == "proposed":
-        test4c_id = p["id"]
-        break
+    dispatch(Action.DDS_APPROVE, {"proposal_id": test4c_id})
+    dispatch(Action.EXECUTE, {"dds_id": test4c_id})  # first exec → success
 
-dispatch(Action.DDS_APPROVE, {"proposal_id": test4c_id})
-dispatch(Action.EXECUTE, {"dds_id": test4c_id})  # first exec → success
+    resp4c = dispatch(Action.EXECUTE, {"dds_id": test4c_id})  # re-exec → should error
+    check("Re-exec → status=error", resp4c.status == "error",
+          f"Got: {resp4c.status}")
 
-resp4c = dispatch(Action.EXECUTE, {"dds_id": test4c_id})  # re-exec → should error
-check("Re-exec → status=error", resp4c.status == "error",
-      f"Got: {resp4c.status}")
+    audit4c = get_last_audit()
+    check("Re-exec audit has error_detail", "dds_error" in audit4c.get("error_detail", ""),
+          f"Got: {audit4c.get('error_detail', '')[:100]}")
 
-audit4c = get_last_audit()
-check("Re-exec audit has error_detail", "dds_error" in audit4c.get("error_detail", ""),
-      f"Got: {audit4c.get('error_detail', '')[:100]}")
+flush_checks()
 
 
 # ══════════════════════════════════════════════
@@ -298,25 +393,42 @@ print(f"\n{SEP}")
 print("TEST 5: P5 — Error category visible in audit error_detail")
 print(SEP)
 
-all_audits = get_all_audits()
-error_audits = [a for a in all_audits if a.get("error_detail")]
-check("Error audits contain category prefix",
-      all(any(cat in a["error_detail"] for cat in ["dds_error", "env_error", "exec_error", "payload_invalid", "source_denied", "handler_exception"])
-          for a in error_audits),
-      f"Found {len(error_audits)} error audits")
+# Single pass over the raw audit lines; only lines that can match are parsed
+flush_audit()
+error_audits = []
+phantom_audits = []
+with open(AUDIT_FILE, "rb") as f:
+    for raw in f:
+        has_err = b'"error_detail"' in raw
+        has_phantom = b"DDS-PHANTOM" in raw
+        if not (has_err or has_phantom):
+            continue
+        entry = _loads(raw)
+        if has_err and entry.get("error_detail"):
+            error_audits.append(entry)
+        if has_phantom and entry.get("payload_summary", {}).get("dds_id") == "DDS-PHANTOM":
+            phantom_audits.append(entry)
+
+uncategorized = [a for a in error_audits if not _ERROR_CATEGORY_RE.search(a["error_detail"])]
+check("Error audits contain category prefix", not uncategorized,
+      f"{len(uncategorized)} error audits without a category")
 
 # Check that the error_detail for phantom DDS contains the category
-phantom_audits = [a for a in all_audits if a.get("payload_summary", {}).get("dds_id") == "DDS-PHANTOM"]
 if phantom_audits:
     check("Phantom DDS error_detail has [dds_error]",
           "dds_error" in phantom_audits[-1].get("error_detail", ""),
           f"Got: {phantom_audits[-1].get('error_detail', '')[:100]}")
 
+flush_checks()
+
 
 # ══════════════════════════════════════════════
 # FINAL SUMMARY
 # ══════════════════════════════════════════════
 
+flush_audit()
+router.close()
+
 print(f"\n{'=' * 70}")
 print(f"VERIFICATION COMPLETE: {PASS} passed, {FAIL} failed")
 print(f"{'=' * 70}")
@@ -3,43 +3,56 @@ Configuration management for AI System
 """
 
 import os
+from dataclasses import dataclass, field, fields
 from typing import Optional
 from dotenv import load_dotenv
 
-# Load environment variables
+# Load environment variables (module import caching runs this once per process)
 load_dotenv()
 
 
+def parse_user_ids(raw: str) -> frozenset[str]:
+    """Parse a comma-separated ALLOWED_USER_IDS value into a set of IDs."""
+    return frozenset(uid.strip() for uid in raw.split(",") if uid.strip())
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Central configuration class"""
-    
+    """Central configuration, read from the environment once at import.
+
+    Field defaults are used when the environment variable is not set.
+    Secrets are kept out of repr().
+    """
+
     # Telegram Bot
-    TELEGRAM_BOT_TOKEN: Optional[str] = os.getenv("TELEGRAM_BOT_TOKEN")
-    
+    TELEGRAM_BOT_TOKEN: Optional[str] = field(default=None, repr=False)
+
     # AI APIs
-    OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
-    
+    OPENAI_API_KEY: Optional[str] = field(default=None, repr=False)
+
     # Gmail OAuth paths (configurable via env vars)
-    GMAIL_CREDENTIALS_PATH: str = os.getenv("GMAIL_CREDENTIALS_PATH", "secrets/credentials.json")
-    GMAIL_TOKEN_PATH: str = os.getenv("GMAIL_TOKEN_PATH", "secrets/token.json")
-    
+    GMAIL_CREDENTIALS_PATH: str = "secrets/credentials.json"
+    GMAIL_TOKEN_PATH: str = "secrets/token.json"
+
     # Environment
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
-    
+    ENVIRONMENT: str = "development"
+
     # Logging
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
-    
+    LOG_LEVEL: str = "INFO"
+
     # Authentication — comma-separated list of allowed user IDs
     # If empty or not set, auth check is DISABLED (development mode)
-    ALLOWED_USER_IDS: str = os.getenv("ALLOWED_USER_IDS", "")
-    
-    @classmethod
-    def validate(cls) -> bool:
+    # Parsed and cached by the Router auth guard (parse_user_ids)
+    ALLOWED_USER_IDS: str = ""
+
+    def validate(self) -> bool:
         """Validate required configuration"""
-        if not cls.TELEGRAM_BOT_TOKEN:
+        if not self.TELEGRAM_BOT_TOKEN:
             raise ValueError("TELEGRAM_BOT_TOKEN is required")
         return True
 
 
+_DEFAULTS = {f.name: f.default for f in fields(Config)}
+
 # Global config instance
-config = Config()
+config = Config(**{k: os.getenv(k, default) for k, default in _DEFAULTS.items()})
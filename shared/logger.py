@@ -6,11 +6,52 @@ import logging
 import sys
 from typing import Optional
 
-try:
-    import colorlog
-    HAS_COLORLOG = True
-except ImportError:
-    HAS_COLORLOG = False
+# Loggers already returned by get_logger(), by name
+_logger_cache: dict[str, logging.Logger] = {}
+
+def _build_console_handler(level: int) -> logging.Handler:
+    """Build the console handler, colored when stdout is a terminal."""
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(level)
+    
+    # Format — colorlog is only imported (and only used) for a terminal
+    formatter = None
+    if sys.stdout.isatty():
+        try:
+            import colorlog
+            formatter = colorlog.ColoredFormatter(
+                "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+                log_colors={
+                    'DEBUG': 'cyan',
+                    'INFO': 'green',
+                    'WARNING': 'yellow',
+                    'ERROR': 'red',
+                    'CRITICAL': 'red,bg_white',
+                }
+            )
+        except ImportError:
+            pass
+    if formatter is None:
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
+    
+    console_handler.setFormatter(formatter)
+    return console_handler
+
+
+def _build_file_handler(level: int, log_file: str) -> logging.Handler:
+    """Build the file handler that writes log records to log_file."""
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setLevel(level)
+    file_formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+    file_handler.setFormatter(file_formatter)
+    return file_handler
 
 
 def setup_logger(
@@ -30,47 +71,21 @@ def setup_logger(
         Configured logger instance
     """
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
     
-    # Remove existing handlers
-    logger.handlers = []
+    # Already configured — don't rebuild handlers and formatters
+    if logger.handlers:
+        return logger
     
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, level.upper()))
+    lvl = getattr(logging, level.upper())
+    logger.setLevel(lvl)
     
-    # Format
-    if HAS_COLORLOG:
-        formatter = colorlog.ColoredFormatter(
-            "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-            log_colors={
-                'DEBUG': 'cyan',
-                'INFO': 'green',
-                'WARNING': 'yellow',
-                'ERROR': 'red',
-                'CRITICAL': 'red,bg_white',
-            }
-        )
-    else:
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-    
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    # Console output stays synchronous so log lines keep their order
+    # relative to print() on the same stdout.
+    logger.addHandler(_build_console_handler(lvl))
     
     # File handler (optional)
     if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, level.upper()))
-        file_formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        logger.addHandler(_build_file_handler(lvl, log_file))
     
     return logger
 
@@ -86,7 +101,10 @@ def get_logger(name: str, level: str = "INFO") -> logging.Logger:
     Returns:
         Configured logger instance
     """
-    return setup_logger(name, level)
+    logger = _logger_cache.get(name)
+    if logger is None:
+        logger = _logger_cache[name] = setup_logger(name, level)
+    return logger
 
 
 # Default logger
@@ -0,0 +1,6 @@
+"""
+Shared pytest configuration for the test suite.
+
+Tests are collected by pytest (parametrized cases, fixtures); keep shared
+fixtures here rather than in individual test modules.
+"""
@@ -14,13 +14,16 @@ These tests validate:
 - Dispatch routing to correct handlers
 """
 
+import io
 import json
 import os
+import subprocess
 import sys
-import tempfile
-import unittest
 from unittest.mock import patch, MagicMock
 from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
 
 # Ensure project root is in path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -34,6 +37,8 @@ from node_interface.contract import (
     is_write,
     validate_payload,
     validate_source_permission,
+    ACTIONS_WITHOUT_SCHEMA,
+    AUDIT_PREFIX,
     PAYLOAD_SCHEMAS,
     _READ_ONLY_ACTIONS,
     _WRITE_ACTIONS,
@@ -45,65 +50,72 @@ from node_interface.contract import (
 # CONTRACT TESTS
 # ──────────────────────────────────────────────
 
-class TestActionWhitelist(unittest.TestCase):
+class TestActionWhitelist:
     """Test that the Action enum is a closed, complete whitelist."""
 
     def test_all_actions_are_classified(self):
         """Every action must be either read-only or write — no orphans."""
         all_actions = set(Action)
         classified = _READ_ONLY_ACTIONS | _WRITE_ACTIONS
-        self.assertEqual(all_actions, classified,
-            f"Unclassified actions: {all_actions - classified}")
+        assert all_actions == classified, f"Unclassified actions: {all_actions - classified}"
 
     def test_no_overlap_between_read_and_write(self):
         """An action cannot be both read-only and write."""
         overlap = _READ_ONLY_ACTIONS & _WRITE_ACTIONS
-        self.assertEqual(len(overlap), 0,
-            f"Actions in both read and write: {overlap}")
+        assert not overlap, f"Actions in both read and write: {overlap}"
 
     def test_read_only_count(self):
         """Sanity check: 10 read-only actions."""
-        self.assertEqual(len(_READ_ONLY_ACTIONS), 10)
+        assert len(_READ_ONLY_ACTIONS) == 10
 
     def test_write_count(self):
         """Sanity check: 5 write actions."""
-        self.assertEqual(len(_WRITE_ACTIONS), 5)
+        assert len(_WRITE_ACTIONS) == 5
 
     def test_is_read_only_helper(self):
-        self.assertTrue(is_read_only(Action.SYSTEM_STATUS))
-        self.assertTrue(is_read_only(Action.DDS_LIST))
-        self.assertTrue(is_read_only(Action.TODO_LIST))
-        self.assertFalse(is_read_only(Action.EXECUTE))
-        self.assertFalse(is_read_only(Action.DDS_APPROVE))
+        assert is_read_only(Action.SYSTEM_STATUS)
+        assert is_read_only(Action.DDS_LIST)
+        assert is_read_only(Action.TODO_LIST)
+        assert not is_read_only(Action.EXECUTE)
+        assert not is_read_only(Action.DDS_APPROVE)
 
     def test_is_write_helper(self):
-        self.assertTrue(is_write(Action.EXECUTE))
-        self.assertTrue(is_write(Action.DDS_NEW))
-        self.assertTrue(is_write(Action.TODO_TO_DDS))
-        self.assertFalse(is_write(Action.SYSTEM_STATUS))
-        self.assertFalse(is_write(Action.INBOX))
+        assert is_write(Action.EXECUTE)
+        assert is_write(Action.DDS_NEW)
+        assert is_write(Action.TODO_TO_DDS)
+        assert not is_write(Action.SYSTEM_STATUS)
+        assert not is_write(Action.INBOX)
 
 
-class TestPayloadValidation(unittest.TestCase):
+class TestPayloadValidation:
     """Test payload schema enforcement."""
 
-    def test_no_schema_actions_accept_empty_payload(self):
+    @pytest.mark.parametrize(
+        "action",
+        sorted(ACTIONS_WITHOUT_SCHEMA, key=lambda a: a.value),
+        ids=lambda a: a.value,
+    )
+    def test_no_schema_actions_accept_empty_payload(self, action):
         """Actions without schemas (e.g. SYSTEM_STATUS) accept empty payloads."""
-        actions_without_schema = set(Action) - set(PAYLOAD_SCHEMAS.keys())
-        for action in actions_without_schema:
-            # Should not raise
-            validate_payload(action, {})
-
-    def test_required_field_missing_raises(self):
+        # Should not raise
+        validate_payload(action, {})
+
+    def test_actions_without_schema_is_immutable(self):
+        """ACTIONS_WITHOUT_SCHEMA is a frozenset of the actions with no schema."""
+        assert isinstance(ACTIONS_WITHOUT_SCHEMA, frozenset)
+        assert ACTIONS_WITHOUT_SCHEMA == frozenset(Action) - PAYLOAD_SCHEMAS.keys()
+        with pytest.raises(AttributeError):
+            ACTIONS_WITHOUT_SCHEMA.add(Action.EXECUTE)
+
+    @pytest.mark.parametrize(
+        "action",
+        [Action.PROJECT_INFO, Action.EXECUTE, Action.DDS_APPROVE],
+        ids=lambda a: a.value,
+    )
+    def test_required_field_missing_raises(self, action):
         """Missing a required field must raise ContractError."""
-        with self.assertRaises(ContractError):
-            validate_payload(Action.PROJECT_INFO, {})
-
-        with self.assertRaises(ContractError):
-            validate_payload(Action.EXECUTE, {})
-
-        with self.assertRaises(ContractError):
-            validate_payload(Action.DDS_APPROVE, {})
+        with pytest.raises(ContractError):
+            validate_payload(action, {})
 
     def test_required_field_present_passes(self):
         """Providing required fields must not raise."""
@@ -127,49 +139,52 @@ class TestPayloadValidation(unittest.TestCase):
         })
 
 
-class TestSourcePermissions(unittest.TestCase):
+class TestSourcePermissions:
     """Test source-based access control."""
 
-    def test_telegram_has_full_access(self):
+    @pytest.mark.parametrize("action", list(Action), ids=lambda a: a.value)
+    def test_telegram_has_full_access(self, action):
         """Telegram can invoke all actions."""
-        for action in Action:
-            validate_source_permission("telegram", action)
+        validate_source_permission("telegram", action)
 
-    def test_cli_has_full_access(self):
+    @pytest.mark.parametrize("action", list(Action), ids=lambda a: a.value)
+    def test_cli_has_full_access(self, action):
         """CLI can invoke all actions."""
-        for action in Action:
-            validate_source_permission("cli", action)
+        validate_source_permission("cli", action)
 
-    def test_voice_can_read(self):
+    @pytest.mark.parametrize("action", sorted(_READ_ONLY_ACTIONS, key=lambda a: a.value), ids=lambda a: a.value)
+    def test_voice_can_read(self, action):
         """Voice source can invoke read-only actions."""
-        for action in _READ_ONLY_ACTIONS:
-            validate_source_permission("voice", action)
+        validate_source_permission("voice", action)
 
-    def test_voice_cannot_write(self):
+    @pytest.mark.parametrize("action", sorted(_WRITE_ACTIONS, key=lambda a: a.value), ids=lambda a: a.value)
+    def test_voice_cannot_write(self, action):
         """Voice source cannot invoke write actions."""
-        for action in _WRITE_ACTIONS:
-            with self.assertRaises(ContractError):
-                validate_source_permission("voice", action)
+        with pytest.raises(ContractError):
+            validate_source_permission("voice", action)
 
-    def test_unknown_source_rejected(self):
-        """Unknown source is rejected for any action."""
-        with self.assertRaises(ContractError):
-            validate_source_permission("unknown_source", Action.SYSTEM_STATUS)
+    def test_permissions_are_read_only(self):
+        """SOURCE_PERMISSIONS cannot be modified at runtime."""
+        with pytest.raises(TypeError):
+            SOURCE_PERMISSIONS["voice"] = frozenset(Action)
 
-        with self.assertRaises(ContractError):
-            validate_source_permission("", Action.SYSTEM_STATUS)
+    @pytest.mark.parametrize("source", ["unknown_source", ""], ids=["unknown", "empty"])
+    def test_unknown_source_rejected(self, source):
+        """Unknown source is rejected for any action."""
+        with pytest.raises(ContractError):
+            validate_source_permission(source, Action.SYSTEM_STATUS)
 
 
-class TestContractRequest(unittest.TestCase):
+class TestContractRequest:
     """Test ContractRequest construction."""
 
     def test_defaults(self):
         req = ContractRequest(action=Action.SYSTEM_STATUS)
-        self.assertEqual(req.action, Action.SYSTEM_STATUS)
-        self.assertEqual(req.payload, {})
-        self.assertEqual(req.source, "unknown")
-        self.assertEqual(req.user_id, "unknown")
-        self.assertIsInstance(req.timestamp, str)
+        assert req.action == Action.SYSTEM_STATUS
+        assert req.payload == {}
+        assert req.source == "unknown"
+        assert req.user_id == "unknown"
+        assert isinstance(req.timestamp, str)
 
     def test_explicit_fields(self):
         req = ContractRequest(
@@ -178,87 +193,103 @@ class TestContractRequest(unittest.TestCase):
             source="telegram",
             user_id="42",
         )
-        self.assertEqual(req.payload["dds_id"], "DDS-123")
-        self.assertEqual(req.source, "telegram")
-        self.assertEqual(req.user_id, "42")
+        assert req.payload["dds_id"] == "DDS-123"
+        assert req.source == "telegram"
+        assert req.user_id == "42"
 
 
-class TestContractResponse(unittest.TestCase):
+class TestContractResponse:
     """Test ContractResponse construction."""
 
     def test_defaults(self):
         resp = ContractResponse(status="ok", message="test")
-        self.assertEqual(resp.status, "ok")
-        self.assertEqual(resp.message, "test")
-        self.assertIsNone(resp.data)
-        self.assertTrue(resp.read_only)
-        self.assertTrue(resp.audit_id.startswith("AUD-"))
+        assert resp.status == "ok"
+        assert resp.message == "test"
+        assert resp.data is None
+        assert resp.read_only
+        assert resp.audit_id.startswith(AUDIT_PREFIX)
 
     def test_audit_id_unique(self):
-        resp1 = ContractResponse(status="ok", message="a")
-        resp2 = ContractResponse(status="ok", message="b")
-        # audit_ids include microseconds, should differ
-        # (in rare cases they could match, but this is a sanity check)
-        self.assertIsInstance(resp1.audit_id, str)
-        self.assertIsInstance(resp2.audit_id, str)
+        # audit_ids come from a per-process counter, so bursts never collide
+        ids = {ContractResponse(status="ok", message="a").audit_id for _ in range(1000)}
+        assert len(ids) == 1000
 
 
 # ──────────────────────────────────────────────
 # ROUTER DISPATCH TESTS
 # ──────────────────────────────────────────────
 
-class TestRouterDispatch(unittest.TestCase):
-    """Test Router.dispatch() guard chain and routing."""
+# Heavy handler modules replaced with mocks when not already imported
+HANDLER_MODULES = (
+    'node_events.github_reader',
+    'node_events.summarizer',
+    'node_events.gmail_reader',
+    'node_projects.project_registry',
+    'node_projects.project_status',
+    'node_dds.dds_registry',
+    'node_dds.dds_proposal',
+    'node_programmer.programmer',
+    'node_programmer.execution_report',
+    'node_todo',
+)
+
 
-    def setUp(self):
-        """Create a Router instance with mocked dependencies."""
-        # Patch heavy imports to avoid loading real modules
-        self.patches = []
-        
-        for module_name in [
-            'node_events.github_reader',
-            'node_events.summarizer',
-            'node_events.gmail_reader',
-            'node_projects.project_registry',
-            'node_projects.project_status',
-            'node_dds.dds_registry',
-            'node_dds.dds_proposal',
-            'node_programmer.programmer',
-            'node_programmer.execution_report',
-            'node_todo',
-        ]:
-            if module_name not in sys.modules:
-                p = patch.dict('sys.modules', {module_name: MagicMock()})
-                p.start()
-                self.patches.append(p)
-
-        # Now import Router (which imports the above)
-        # We need to reload to pick up the mocks
-        import importlib
-        if 'node_interface.router' in sys.modules:
-            importlib.reload(sys.modules['node_interface.router'])
-        
+@pytest.fixture(scope="module")
+def router():
+    """One Router, built with mocked dependencies, shared by all dispatch tests."""
+    # Patch heavy imports in one sys.modules update to avoid loading real modules
+    missing = {m: MagicMock() for m in HANDLER_MODULES if m not in sys.modules}
+    with patch.dict(sys.modules, missing):
+        # Router() imports its handler modules, so it binds the mocks
         from node_interface.router import Router
-        self.router = Router()
+        yield Router(audit_sink=io.StringIO())
+
+
+def _set_router_config(monkeypatch, **overrides):
+    """Swap the router's config for a plain namespace with the given overrides."""
+    settings = {
+        "ALLOWED_USER_IDS": "",
+        "GMAIL_CREDENTIALS_PATH": "secrets/credentials.json",
+        "GMAIL_TOKEN_PATH": "secrets/token.json",
+        **overrides,
+    }
+    monkeypatch.setattr("node_interface.router.config", SimpleNamespace(**settings))
+
 
-    def tearDown(self):
-        for p in self.patches:
-            p.stop()
+# Rebinds node_interface.router handler modules to sys.modules mocks; keep on one xdist worker
+@pytest.mark.xdist_group("router_reload")
+class TestRouterDispatch:
+    """Test Router.dispatch() guard chain and routing."""
 
-    def test_system_status_returns_ok(self):
+    def test_system_status_returns_ok(self, router):
         """Basic dispatch to system_status works."""
         req = ContractRequest(
             action=Action.SYSTEM_STATUS,
             source="telegram",
             user_id="123",
         )
-        resp = self.router.dispatch(req)
-        self.assertEqual(resp.status, "ok")
-        self.assertIn("AI System Status", resp.message)
-        self.assertTrue(resp.read_only)
-        self.assertEqual(resp.action, Action.SYSTEM_STATUS)
+        resp = router.dispatch(req)
+        assert resp.status == "ok"
+        assert "AI System Status" in resp.message
+        assert resp.read_only
+        assert resp.action == Action.SYSTEM_STATUS
+
+    def test_dds_new_returns_proposal_id_in_data(self, router, monkeypatch):
+        """DDS_NEW exposes the created proposal ID in response.data."""
+        monkeypatch.setattr(router, "_dds_registry", MagicMock())
+        req = ContractRequest(
+            action=Action.DDS_NEW,
+            payload={"project": "FitnessAi", "title": "T", "description": "D"},
+            source="telegram",
+            user_id="123",
+        )
+        resp = router.dispatch(req)
+        assert resp.status == "ok"
+        proposal_id = resp.data["proposal_id"]
+        assert proposal_id.startswith("DDS-")
+        assert f"ID: {proposal_id}" in resp.message
 
-    def test_missing_payload_field_returns_error(self):
+    def test_missing_payload_field_returns_error(self, router):
         """Dispatch with missing required payload field returns error."""
         req = ContractRequest(
             action=Action.EXECUTE,
@@ -266,32 +297,32 @@ class TestRouterDispatch(unittest.TestCase):
             source="telegram",
             user_id="123",
         )
-        resp = self.router.dispatch(req)
-        self.assertEqual(resp.status, "error")
-        self.assertIn("Payload inválido", resp.message)
+        resp = router.dispatch(req)
+        assert resp.status == "error"
+        assert "Payload inválido" in resp.message
 
-    def test_unknown_source_returns_error(self):
+    def test_unknown_source_returns_error(self, router):
         """Dispatch from unknown source is rejected."""
         req = ContractRequest(
             action=Action.SYSTEM_STATUS,
             source="unknown_source",
             user_id="123",
         )
-        resp = self.router.dispatch(req)
-        self.assertEqual(resp.status, "error")
-        self.assertIn("Permiso denegado", resp.message)
+        resp = router.dispatch(req)
+        assert resp.status == "error"
+        assert "Permiso denegado" in resp.message
 
-    def test_voice_read_only_allowed(self):
+    def test_voice_read_only_allowed(self, router):
         """Voice source can dispatch read-only actions."""
         req = ContractRequest(
             action=Action.SYSTEM_STATUS,
             source="voice",
             user_id="123",
         )
-        resp = self.router.dispatch(req)
-        self.assertEqual(resp.status, "ok")
+        resp = router.dispatch(req)
+        assert resp.status == "ok"
 
-    def test_voice_write_blocked(self):
+    def test_voice_write_blocked(self, router):
         """Voice source cannot dispatch write actions."""
         req = ContractRequest(
             action=Action.EXECUTE,
@@ -299,65 +330,58 @@ class TestRouterDispatch(unittest.TestCase):
             source="voice",
             user_id="123",
         )
-        resp = self.router.dispatch(req)
-        self.assertEqual(resp.status, "error")
-        self.assertIn("Permiso denegado", resp.message)
+        resp = router.dispatch(req)
+        assert resp.status == "error"
+        assert "Permiso denegado" in resp.message
 
-    @patch('node_interface.router.config')
-    def test_auth_blocks_unauthorized_user(self, mock_config):
+    def test_auth_blocks_unauthorized_user(self, router, monkeypatch):
         """When ALLOWED_USER_IDS is set, unknown user is rejected."""
-        mock_config.ALLOWED_USER_IDS = "100,200,300"
-        mock_config.GMAIL_CREDENTIALS_PATH = "secrets/credentials.json"
-        mock_config.GMAIL_TOKEN_PATH = "secrets/token.json"
-        
+        _set_router_config(monkeypatch, ALLOWED_USER_IDS="100,200,300")
+
         req = ContractRequest(
             action=Action.SYSTEM_STATUS,
             source="telegram",
             user_id="999",
         )
-        resp = self.router.dispatch(req)
-        self.assertEqual(resp.status, "error")
-        self.assertIn("no autorizado", resp.message)
+        resp = router.dispatch(req)
+        assert resp.status == "error"
+        assert "no autorizado" in resp.message
 
-    @patch('node_interface.router.config')
-    def test_auth_allows_authorized_user(self, mock_config):
+    def test_auth_allows_authorized_user(self, router, monkeypatch):
         """When ALLOWED_USER_IDS is set, listed user passes."""
-        mock_config.ALLOWED_USER_IDS = "100,200,300"
-        mock_config.GMAIL_CREDENTIALS_PATH = "secrets/credentials.json"
-        mock_config.GMAIL_TOKEN_PATH = "secrets/token.json"
-        
+        _set_router_config(monkeypatch, ALLOWED_USER_IDS="100,200,300")
+
         req = ContractRequest(
             action=Action.SYSTEM_STATUS,
             source="telegram",
             user_id="200",
         )
-        resp = self.router.dispatch(req)
-        self.assertEqual(resp.status, "ok")
+        resp = router.dispatch(req)
+        assert resp.status == "ok"
 
-    @patch('node_interface.router.config')
-    def test_auth_disabled_when_empty(self, mock_config):
+    def test_auth_disabled_when_empty(self, router, monkeypatch):
         """When ALLOWED_USER_IDS is empty, all users pass (dev mode)."""
-        mock_config.ALLOWED_USER_IDS = ""
-        
+        _set_router_config(monkeypatch, ALLOWED_USER_IDS="")
+
         req = ContractRequest(
             action=Action.SYSTEM_STATUS,
             source="telegram",
             user_id="any_user",
         )
-        resp = self.router.dispatch(req)
-        self.assertEqual(resp.status, "ok")
+        resp = router.dispatch(req)
+        assert resp.status == "ok"
 
-    def test_dispatch_response_has_audit_id(self):
+    def test_dispatch_response_has_audit_id(self, router):
         """Every response includes an audit_id."""
         req = ContractRequest(
             action=Action.SYSTEM_STATUS,
             source="telegram",
             user_id="123",
         )
-        resp = self.router.dispatch(req)
-        self.assertTrue(resp.audit_id.startswith("AUD-"))
+        resp = router.dispatch(req)
+        assert resp.audit_id.startswith(AUDIT_PREFIX)
 
-    def test_dispatch_read_only_flag_correct(self):
+    def test_dispatch_read_only_flag_correct(self, router):
         """Read-only flag in response matches action classification."""
         # Read action
         req_read = ContractRequest(
@@ -365,171 +389,192 @@ class TestRouterDispatch(unittest.TestCase):
             source="telegram",
             user_id="123",
         )
-        resp_read = self.router.dispatch(req_read)
-        self.assertTrue(resp_read.read_only)
+        resp_read = router.dispatch(req_read)
+        assert resp_read.read_only
+
+
+def test_importing_router_does_not_load_handler_modules():
+    """Handler modules are imported by Router(), not by importing the module."""
+    code = (
+        "import sys, node_interface.router; "
+        f"print(any(m in sys.modules for m in {HANDLER_MODULES!r}))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.join(os.path.dirname(__file__), '..'),
+        capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_reset_handlers_rebinds_from_sys_modules():
+    """reset_handlers() picks up module mocks for that Router only."""
+    from node_interface.router import Router
+    r = Router(audit_sink=io.StringIO())
+    other = Router(audit_sink=io.StringIO())
+    real_registry = other._deps.DDSRegistry
+    fake = MagicMock()
+    with patch.dict(sys.modules, {'node_dds.dds_registry': fake}):
+        r.reset_handlers()
+    assert r._deps.DDSRegistry is fake.DDSRegistry
+    assert r._dds_registry is None
+    assert other._deps.DDSRegistry is real_registry
+
+    r.reset_handlers()
+    assert r._deps.DDSRegistry is real_registry
 
 
 # ──────────────────────────────────────────────
 # AUDIT PERSISTENCE TESTS
 # ──────────────────────────────────────────────
 
-class TestAuditPersistence(unittest.TestCase):
-    """Test that audit entries are written to disk."""
-
-    def test_audit_entry_written(self):
-        """Dispatching an action writes an audit line to the JSONL file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            audit_file = os.path.join(tmpdir, "audit.jsonl")
-
-            # Patch the audit file path
-            import node_interface.router as router_module
-            original_audit = router_module.AUDIT_FILE
-            router_module.AUDIT_FILE = audit_file
-
-            try:
-                from node_interface.router import Router
-                r = Router()
-                req = ContractRequest(
-                    action=Action.SYSTEM_STATUS,
-                    source="telegram",
-                    user_id="42",
-                )
-                resp = r.dispatch(req)
-
-                # File should exist and contain one line
-                self.assertTrue(os.path.exists(audit_file))
-                with open(audit_file, "r") as f:
-                    lines = f.readlines()
-                self.assertEqual(len(lines), 1)
-
-                entry = json.loads(lines[0])
-                self.assertEqual(entry["action"], "system_status")
-                self.assertEqual(entry["source"], "telegram")
-                self.assertEqual(entry["user_id"], "42")
-                self.assertEqual(entry["status"], "ok")
-                self.assertEqual(entry["audit_id"], resp.audit_id)
-                # v1.1 enriched fields
-                self.assertEqual(entry["level"], "info")
-                self.assertIn("duration_ms", entry)
-                self.assertIsInstance(entry["duration_ms"], int)
-                self.assertGreaterEqual(entry["duration_ms"], 0)
-                self.assertIn("payload_summary", entry)
-                self.assertNotIn("error_detail", entry)  # absent on success
-            finally:
-                router_module.AUDIT_FILE = original_audit
-
-    def test_audit_payload_summary_traces_ids(self):
-        """Audit payload_summary captures traceable IDs, not the full payload."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            audit_file = os.path.join(tmpdir, "audit.jsonl")
-
-            import node_interface.router as router_module
-            original_audit = router_module.AUDIT_FILE
-            router_module.AUDIT_FILE = audit_file
-
-            try:
-                from node_interface.router import Router
-                r = Router()
-                # This will fail validation (missing required field) but
-                # payload_summary should still capture the dds_id if present
-                r.dispatch(ContractRequest(
-                    action=Action.PROJECT_INFO,
-                    payload={"name": "fitnessai", "extra": "ignored"},
-                    source="telegram",
-                    user_id="42",
-                ))
-
-                with open(audit_file, "r") as f:
-                    entry = json.loads(f.readline())
-                # "name" is traceable, "extra" is not
-                self.assertEqual(entry["payload_summary"]["name"], "fitnessai")
-                self.assertNotIn("extra", entry["payload_summary"])
-            finally:
-                router_module.AUDIT_FILE = original_audit
-
-    def test_audit_error_has_detail_and_level(self):
-        """Failed dispatches include error_detail and level=guard_reject."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            audit_file = os.path.join(tmpdir, "audit.jsonl")
-
-            import node_interface.router as router_module
-            original_audit = router_module.AUDIT_FILE
-            router_module.AUDIT_FILE = audit_file
-
-            try:
-                from node_interface.router import Router
-                r = Router()
-                # Trigger payload validation failure
-                r.dispatch(ContractRequest(
-                    action=Action.EXECUTE,
-                    payload={},
-                    source="telegram",
-                    user_id="42",
-                ))
-
-                with open(audit_file, "r") as f:
-                    entry = json.loads(f.readline())
-                self.assertEqual(entry["level"], "guard_reject")
-                self.assertIn("error_detail", entry)
-                self.assertIn("payload_invalid", entry["error_detail"])
-            finally:
-                router_module.AUDIT_FILE = original_audit
-
-    def test_multiple_dispatches_append(self):
-        """Multiple dispatches append lines, never overwrite."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            audit_file = os.path.join(tmpdir, "audit.jsonl")
-
-            import node_interface.router as router_module
-            original_audit = router_module.AUDIT_FILE
-            router_module.AUDIT_FILE = audit_file
-
-            try:
-                from node_interface.router import Router
-                r = Router()
-                for _ in range(3):
-                    r.dispatch(ContractRequest(
-                        action=Action.SYSTEM_STATUS,
-                        source="telegram",
-                        user_id="42",
-                    ))
-
-                with open(audit_file, "r") as f:
-                    lines = f.readlines()
-                self.assertEqual(len(lines), 3)
-            finally:
-                router_module.AUDIT_FILE = original_audit
-
-    def test_error_responses_are_audited(self):
-        """Even failed dispatches (payload error, auth error) are audited."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            audit_file = os.path.join(tmpdir, "audit.jsonl")
-
-            import node_interface.router as router_module
-            original_audit = router_module.AUDIT_FILE
-            router_module.AUDIT_FILE = audit_file
-
-            try:
-                from node_interface.router import Router
-                r = Router()
-                # This should fail (missing required field)
-                r.dispatch(ContractRequest(
-                    action=Action.EXECUTE,
-                    payload={},
-                    source="telegram",
-                    user_id="42",
-                ))
-
-                with open(audit_file, "r") as f:
-                    lines = f.readlines()
-                self.assertEqual(len(lines), 1)
-                entry = json.loads(lines[0])
-                self.assertEqual(entry["status"], "error")
-                self.assertIn("error_detail", entry)
-                self.assertGreaterEqual(entry["duration_ms"], 0)
-            finally:
-                router_module.AUDIT_FILE = original_audit
+@pytest.fixture(scope="module")
+def audited_router():
+    """One Router for all audit tests, writing to an in-memory sink."""
+    from node_interface.router import Router
+    sink = io.StringIO()
+    return Router(audit_sink=sink), sink
+
+
+@pytest.fixture
+def audited(audited_router):
+    """The shared Router and a reader for the audit lines this test appends."""
+    router, sink = audited_router
+    offset = sink.tell()
+    return router, lambda: sink.getvalue()[offset:].splitlines()
+
+
+def test_audit_entry_written(audited):
+    """Dispatching an action writes one audit line to the sink."""
+    router, audit_lines = audited
+    resp = router.dispatch(ContractRequest(
+        action=Action.SYSTEM_STATUS,
+        source="telegram",
+        user_id="42",
+    ))
+
+    lines = audit_lines()
+    assert len(lines) == 1
+
+    entry = json.loads(lines[0])
+    assert entry["action"] == "system_status"
+    assert entry["source"] == "telegram"
+    assert entry["user_id"] == "42"
+    assert entry["status"] == "ok"
+    assert entry["audit_id"] == resp.audit_id
+    # v1.1 enriched fields
+    assert entry["level"] == "info"
+    assert isinstance(entry["duration_ms"], int)
+    assert entry["duration_ms"] >= 0
+    assert "payload_summary" in entry
+    assert "error_detail" not in entry  # absent on success
+
+
+def test_audit_payload_summary_traces_ids(audited):
+    """Audit payload_summary captures traceable IDs, not the full payload."""
+    router, audit_lines = audited
+    router.dispatch(ContractRequest(
+        action=Action.PROJECT_INFO,
+        payload={"name": "fitnessai", "extra": "ignored"},
+        source="telegram",
+        user_id="42",
+    ))
+
+    entry = json.loads(audit_lines()[0])
+    # "name" is traceable, "extra" is not
+    assert entry["payload_summary"]["name"] == "fitnessai"
+    assert "extra" not in entry["payload_summary"]
+
+
+def test_audit_error_has_detail_and_level(audited):
+    """Failed dispatches include error_detail and level=guard_reject."""
+    router, audit_lines = audited
+    # Trigger payload validation failure
+    router.dispatch(ContractRequest(
+        action=Action.EXECUTE,
+        payload={},
+        source="telegram",
+        user_id="42",
+    ))
+
+    entry = json.loads(audit_lines()[0])
+    assert entry["level"] == "guard_reject"
+    assert "payload_invalid" in entry["error_detail"]
+
+
+def test_multiple_dispatches_append(audited):
+    """Multiple dispatches append lines, never overwrite."""
+    router, audit_lines = audited
+    for _ in range(3):
+        router.dispatch(ContractRequest(
+            action=Action.SYSTEM_STATUS,
+            source="telegram",
+            user_id="42",
+        ))
+
+    assert len(audit_lines()) == 3
+
+
+def test_dispatch_many_audits_every_request(audited):
+    """dispatch_many returns one response and one audit line per request."""
+    router, audit_lines = audited
+    req = ContractRequest(action=Action.SYSTEM_STATUS, source="telegram", user_id="42")
+    bad = ContractRequest(action=Action.EXECUTE, source="telegram", user_id="42")
+    resps = router.dispatch_many([req, bad, req])
+
+    assert [r.status for r in resps] == ["ok", "error", "ok"]
+    entries = [json.loads(line) for line in audit_lines()]
+    assert [e["audit_id"] for e in entries] == [r.audit_id for r in resps]
+
+
+def test_error_responses_are_audited(audited):
+    """Even failed dispatches (payload error, auth error) are audited."""
+    router, audit_lines = audited
+    # This should fail (missing required field)
+    router.dispatch(ContractRequest(
+        action=Action.EXECUTE,
+        payload={},
+        source="telegram",
+        user_id="42",
+    ))
+
+    lines = audit_lines()
+    assert len(lines) == 1
+    entry = json.loads(lines[0])
+    assert entry["status"] == "error"
+    assert "error_detail" in entry
+    assert entry["duration_ms"] >= 0
+
+
+def test_default_sink_appends_to_audit_file(tmp_path, monkeypatch):
+    """Without a sink, the Router appends to AUDIT_FILE."""
+    import node_interface.router as router_module
+    audit_file = tmp_path / "audit.jsonl"
+    monkeypatch.setattr(router_module, "AUDIT_FILE", str(audit_file))
+
+    with router_module.Router() as router:
+        for _ in range(2):
+            router.dispatch(ContractRequest(
+                action=Action.SYSTEM_STATUS,
+                source="telegram",
+                user_id="42",
+            ))
+
+    assert len(audit_file.read_text().splitlines()) == 2
+
+
+def test_close_leaves_injected_sink_open(audited_router, audited):
+    """close() only closes the file the Router opened itself."""
+    _, sink = audited_router
+    router, audit_lines = audited
+    router.close()
+    assert not sink.closed
+
+    resp = router.dispatch(ContractRequest(action=Action.SYSTEM_STATUS, source="telegram", user_id="42"))
+    lines = audit_lines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["audit_id"] == resp.audit_id
 
 
 if __name__ == "__main__":
-    unittest.main()
+    sys.exit(pytest.main([__file__]))